@@ -37,7 +37,11 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id'),
     )
-    op.create_index('ix_xp_events_user_created', 'xp_events', ['user_id', 'created_at'])
+    # INCLUDE xp_amount so SUM(xp_amount) range queries are index-only scans
+    op.create_index(
+        'ix_xp_events_user_created', 'xp_events', ['user_id', 'created_at'],
+        postgresql_include=['xp_amount'],
+    )
 
 
 def downgrade() -> None:
@@ -0,0 +1,44 @@
+"""add admin search and keyset indexes
+
+Revision ID: a4b5c6d7e8f9
+Revises: f3a4b5c6d7e8
+Create Date: 2026-08-31 12:00:00.000000
+
+The admin listings seek on (created_at, id) and filter with
+ILIKE '%...%'; a plain btree cannot serve either. Trigram GIN indexes
+make the substring search an index scan, and the users keyset index
+mirrors the ones card_sets already has.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4b5c6d7e8f9'
+down_revision: Union[str, Sequence[str], None] = 'f3a4b5c6d7e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_users_created_id', 'users', ['created_at', 'id'])
+    op.execute(
+        'CREATE INDEX ix_users_email_trgm ON users '
+        'USING gin (email gin_trgm_ops)'
+    )
+    op.execute(
+        'CREATE INDEX ix_users_full_name_trgm ON users '
+        'USING gin (full_name gin_trgm_ops)'
+    )
+    op.execute(
+        'CREATE INDEX ix_card_sets_title_trgm ON card_sets '
+        'USING gin (title gin_trgm_ops)'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_card_sets_title_trgm', table_name='card_sets')
+    op.drop_index('ix_users_full_name_trgm', table_name='users')
+    op.drop_index('ix_users_email_trgm', table_name='users')
+    op.drop_index('ix_users_created_id', table_name='users')
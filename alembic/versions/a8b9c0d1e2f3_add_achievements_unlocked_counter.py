@@ -0,0 +1,46 @@
+"""add denormalized achievements_unlocked counter
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2026-08-31 12:00:00.000000
+
+The profile endpoint counted user_achievements rows on every request;
+the count now lives on user_gamification and is bumped on unlock.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8b9c0d1e2f3'
+down_revision: Union[str, Sequence[str], None] = 'f7a8b9c0d1e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'user_gamification',
+        sa.Column(
+            'achievements_unlocked', sa.Integer(),
+            nullable=False, server_default='0',
+        ),
+    )
+    # Backfill from the existing unlock rows
+    op.execute(
+        """
+        UPDATE user_gamification g
+        SET achievements_unlocked = sub.cnt
+        FROM (
+            SELECT user_id, count(*) AS cnt
+            FROM user_achievements
+            GROUP BY user_id
+        ) sub
+        WHERE sub.user_id = g.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('user_gamification', 'achievements_unlocked')
@@ -17,8 +17,14 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    """Add 'conversation' value to xp_event_type_enum."""
-    op.execute("ALTER TYPE xp_event_type_enum ADD VALUE IF NOT EXISTS 'conversation'")
+    """Add 'conversation' value to xp_event_type_enum.
+
+    ALTER TYPE ... ADD VALUE cannot run inside a transaction block, so the
+    statement is issued in an autocommit block; this keeps the migration
+    online and makes the new value usable immediately.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE xp_event_type_enum ADD VALUE IF NOT EXISTS 'conversation'")
 
 
 def downgrade() -> None:
@@ -0,0 +1,33 @@
+"""index user_gamification.last_activity_date
+
+Revision ID: b5c6d7e8f9a0
+Revises: a4b5c6d7e8f9
+Create Date: 2026-08-31 12:00:00.000000
+
+The platform-stats active_today count scans user_gamification for
+last_activity_date = today; a btree on the column turns that into an
+index-only scan bounded by the day's active users.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5c6d7e8f9a0'
+down_revision: Union[str, Sequence[str], None] = 'a4b5c6d7e8f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_user_gamification_last_activity',
+        'user_gamification',
+        ['last_activity_date'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_user_gamification_last_activity', table_name='user_gamification'
+    )
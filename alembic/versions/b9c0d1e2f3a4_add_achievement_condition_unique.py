@@ -0,0 +1,30 @@
+"""add unique constraint on achievement condition
+
+Revision ID: b9c0d1e2f3a4
+Revises: a8b9c0d1e2f3
+Create Date: 2026-08-31 12:00:00.000000
+
+Backs the ON CONFLICT DO NOTHING bulk seed: dedup moves from a Python
+set over a full-table SELECT to a server-side unique index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9c0d1e2f3a4'
+down_revision: Union[str, Sequence[str], None] = 'a8b9c0d1e2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_unique_constraint(
+        'uq_achievement_condition',
+        'achievements',
+        ['condition_type', 'condition_value'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_achievement_condition', 'achievements', type_='unique')
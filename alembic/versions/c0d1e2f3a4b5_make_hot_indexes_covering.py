@@ -0,0 +1,69 @@
+"""make hot-path indexes covering
+
+Revision ID: c0d1e2f3a4b5
+Revises: b9c0d1e2f3a4
+Create Date: 2026-08-31 12:00:00.000000
+
+Rebuilds the SRS due-card and accepted-friendship indexes with INCLUDE
+payload columns so the hot reads become index-only scans instead of
+paying a heap fetch per row.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0d1e2f3a4b5'
+down_revision: Union[str, Sequence[str], None] = 'b9c0d1e2f3a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_user_card_progress_user_review', table_name='user_card_progress')
+    op.create_index(
+        'ix_user_card_progress_user_review',
+        'user_card_progress',
+        ['user_id', 'next_review_date'],
+        postgresql_include=['card_id', 'ease_factor', 'interval', 'repetitions'],
+    )
+
+    op.drop_index('ix_friendships_user_accepted', table_name='friendships')
+    op.create_index(
+        'ix_friendships_user_accepted',
+        'friendships',
+        ['user_id'],
+        postgresql_include=['friend_id'],
+        postgresql_where="status = 'accepted'",
+    )
+    op.drop_index('ix_friendships_friend_accepted', table_name='friendships')
+    op.create_index(
+        'ix_friendships_friend_accepted',
+        'friendships',
+        ['friend_id'],
+        postgresql_include=['user_id'],
+        postgresql_where="status = 'accepted'",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_friendships_friend_accepted', table_name='friendships')
+    op.create_index(
+        'ix_friendships_friend_accepted',
+        'friendships',
+        ['friend_id'],
+        postgresql_where="status = 'accepted'",
+    )
+    op.drop_index('ix_friendships_user_accepted', table_name='friendships')
+    op.create_index(
+        'ix_friendships_user_accepted',
+        'friendships',
+        ['user_id'],
+        postgresql_where="status = 'accepted'",
+    )
+    op.drop_index('ix_user_card_progress_user_review', table_name='user_card_progress')
+    op.create_index(
+        'ix_user_card_progress_user_review',
+        'user_card_progress',
+        ['user_id', 'next_review_date'],
+    )
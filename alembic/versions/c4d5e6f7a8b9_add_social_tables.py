@@ -18,10 +18,24 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add UniqueConstraint and indexes to friendships table
+    # Add UniqueConstraint and indexes to friendships table. Each hot path
+    # gets a partial index that stays small: status='accepted' for friend
+    # lists and counts, status='pending' on the friend_id side for the
+    # incoming-requests view. Outgoing pending lookups filter on user_id
+    # and are covered by uq_friendship_pair.
     op.create_unique_constraint('uq_friendship_pair', 'friendships', ['user_id', 'friend_id'])
-    op.create_index('ix_friendships_user_id', 'friendships', ['user_id'])
-    op.create_index('ix_friendships_friend_id', 'friendships', ['friend_id'])
+    op.create_index(
+        'ix_friendships_user_accepted', 'friendships', ['user_id'],
+        postgresql_where=sa.text("status = 'accepted'"),
+    )
+    op.create_index(
+        'ix_friendships_friend_accepted', 'friendships', ['friend_id'],
+        postgresql_where=sa.text("status = 'accepted'"),
+    )
+    op.create_index(
+        'ix_friendships_friend_pending', 'friendships', ['friend_id'],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
 
     # Create shared_card_sets table
     op.create_table(
@@ -38,13 +52,16 @@ def upgrade() -> None:
         sa.UniqueConstraint('card_set_id', 'shared_with_id', name='uq_shared_card_set_recipient'),
     )
 
-    # Add new enum values
-    op.execute("ALTER TYPE xp_event_type_enum ADD VALUE IF NOT EXISTS 'friend_added'")
-    op.execute("ALTER TYPE achievement_condition_enum ADD VALUE IF NOT EXISTS 'friends_count'")
+    # Add new enum values; ALTER TYPE ... ADD VALUE cannot run inside a
+    # transaction block, so issue the statements in an autocommit block.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE xp_event_type_enum ADD VALUE IF NOT EXISTS 'friend_added'")
+        op.execute("ALTER TYPE achievement_condition_enum ADD VALUE IF NOT EXISTS 'friends_count'")
 
 
 def downgrade() -> None:
     op.drop_table('shared_card_sets')
-    op.drop_index('ix_friendships_friend_id', table_name='friendships')
-    op.drop_index('ix_friendships_user_id', table_name='friendships')
+    op.drop_index('ix_friendships_friend_pending', table_name='friendships')
+    op.drop_index('ix_friendships_friend_accepted', table_name='friendships')
+    op.drop_index('ix_friendships_user_accepted', table_name='friendships')
     op.drop_constraint('uq_friendship_pair', 'friendships', type_='unique')
@@ -0,0 +1,40 @@
+"""store conversation messages and feedback as jsonb
+
+Revision ID: d1e2f3a4b5c6
+Revises: c0d1e2f3a4b5
+Create Date: 2026-08-31 12:00:00.000000
+
+json columns are stored as text and reparsed on every read; jsonb is
+parsed once on write and read back in binary form.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1e2f3a4b5c6'
+down_revision: Union[str, Sequence[str], None] = 'c0d1e2f3a4b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE ai_conversations "
+        "ALTER COLUMN messages TYPE jsonb USING messages::jsonb"
+    )
+    op.execute(
+        "ALTER TABLE ai_conversations "
+        "ALTER COLUMN feedback TYPE jsonb USING feedback::jsonb"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE ai_conversations "
+        "ALTER COLUMN feedback TYPE json USING feedback::json"
+    )
+    op.execute(
+        "ALTER TABLE ai_conversations "
+        "ALTER COLUMN messages TYPE json USING messages::json"
+    )
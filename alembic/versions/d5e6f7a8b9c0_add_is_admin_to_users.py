@@ -9,7 +9,9 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column("users", sa.Column("is_admin", sa.Boolean(), nullable=False, server_default="false"))
+    # sa.false() renders a constant default, so PG11+ applies the NOT NULL
+    # column as a metadata-only change instead of rewriting the table
+    op.add_column("users", sa.Column("is_admin", sa.Boolean(), nullable=False, server_default=sa.false()))
 
 
 def downgrade() -> None:
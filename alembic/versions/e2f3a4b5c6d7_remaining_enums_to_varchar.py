@@ -0,0 +1,116 @@
+"""convert remaining native enum columns to varchar
+
+Revision ID: e2f3a4b5c6d7
+Revises: d1e2f3a4b5c6
+Create Date: 2026-08-31 12:00:00.000000
+
+Finishes what e6f7a8b9c0d1 started for xp_events and achievements:
+language_level, card_type, friendship_status and league move from
+native Postgres enum types to VARCHAR + CHECK, so new values become a
+metadata-only constraint swap instead of an ALTER TYPE.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2f3a4b5c6d7'
+down_revision: Union[str, Sequence[str], None] = 'd1e2f3a4b5c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LANGUAGE_LEVELS = ('A1', 'A2', 'B1', 'B2', 'C1', 'C2')
+CARD_TYPES = (
+    'flashcard', 'fill_blank', 'match', 'listening',
+    'multiple_choice', 'sentence_build', 'visual',
+)
+FRIENDSHIP_STATUSES = ('pending', 'accepted')
+LEAGUES = ('Bronze', 'Silver', 'Gold', 'Platinum', 'Diamond')
+
+# (table, column, check name, allowed values, enum type name)
+_COLUMNS = (
+    ('users', 'language_level', 'ck_users_language_level',
+     LANGUAGE_LEVELS, 'language_level_enum'),
+    ('card_sets', 'difficulty_level', 'ck_card_sets_difficulty_level',
+     LANGUAGE_LEVELS, 'language_level_enum'),
+    ('cards', 'card_type', 'ck_cards_card_type',
+     CARD_TYPES, 'card_type_enum'),
+    ('friendships', 'status', 'ck_friendships_status',
+     FRIENDSHIP_STATUSES, 'friendship_status_enum'),
+    ('user_gamification', 'league', 'ck_user_gamification_league',
+     LEAGUES, 'league_enum'),
+)
+
+
+def _quoted(values: tuple[str, ...]) -> str:
+    return ", ".join(f"'{v}'" for v in values)
+
+
+def _drop_friendship_indexes() -> None:
+    # The friendship partial indexes (c4d5e6f7a8b9 / c0d1e2f3a4b5) carry
+    # enum-typed predicate constants like 'accepted'::friendship_status_enum,
+    # so Postgres cannot rebuild them across the column type change and
+    # they would pin the enum type against DROP TYPE. Recreate them on
+    # the other side of the conversion instead.
+    op.drop_index('ix_friendships_user_accepted', table_name='friendships')
+    op.drop_index('ix_friendships_friend_accepted', table_name='friendships')
+    op.drop_index('ix_friendships_friend_pending', table_name='friendships')
+
+
+def _create_friendship_indexes() -> None:
+    op.create_index(
+        'ix_friendships_user_accepted',
+        'friendships',
+        ['user_id'],
+        postgresql_include=['friend_id'],
+        postgresql_where="status = 'accepted'",
+    )
+    op.create_index(
+        'ix_friendships_friend_accepted',
+        'friendships',
+        ['friend_id'],
+        postgresql_include=['user_id'],
+        postgresql_where="status = 'accepted'",
+    )
+    op.create_index(
+        'ix_friendships_friend_pending',
+        'friendships',
+        ['friend_id'],
+        postgresql_where="status = 'pending'",
+    )
+
+
+def upgrade() -> None:
+    _drop_friendship_indexes()
+    for table, column, ck_name, values, _enum in _COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.String(32),
+            postgresql_using=f'{column}::text',
+        )
+        op.create_check_constraint(
+            ck_name, table, f"{column} IN ({_quoted(values)})",
+        )
+    for enum_name in ('card_type_enum', 'friendship_status_enum',
+                      'league_enum', 'language_level_enum'):
+        op.execute(f'DROP TYPE {enum_name}')
+    _create_friendship_indexes()
+
+
+def downgrade() -> None:
+    _drop_friendship_indexes()
+    op.execute(f"CREATE TYPE language_level_enum AS ENUM ({_quoted(LANGUAGE_LEVELS)})")
+    op.execute(f"CREATE TYPE card_type_enum AS ENUM ({_quoted(CARD_TYPES)})")
+    op.execute(
+        f"CREATE TYPE friendship_status_enum AS ENUM ({_quoted(FRIENDSHIP_STATUSES)})"
+    )
+    op.execute(f"CREATE TYPE league_enum AS ENUM ({_quoted(LEAGUES)})")
+    for table, column, ck_name, _values, enum_name in _COLUMNS:
+        op.drop_constraint(ck_name, table)
+        op.alter_column(
+            table, column,
+            type_=sa.Enum(name=enum_name),
+            postgresql_using=f'{column}::{enum_name}',
+        )
+    _create_friendship_indexes()
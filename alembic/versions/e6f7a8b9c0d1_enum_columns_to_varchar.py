@@ -0,0 +1,77 @@
+"""convert xp_event_type and achievement_condition enums to varchar
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-08-31 10:00:00.000000
+
+Native Postgres enums need an ALTER TYPE (with its locking and
+transaction caveats) every time a value is added. VARCHAR + CHECK makes
+future values a metadata-only constraint swap.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6f7a8b9c0d1'
+down_revision: Union[str, Sequence[str], None] = 'd5e6f7a8b9c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+XP_EVENT_TYPES = (
+    'review', 'set_created', 'ai_generation', 'conversation',
+    'achievement_bonus', 'friend_added',
+)
+ACHIEVEMENT_CONDITIONS = (
+    'cards_learned', 'streak_days', 'conversations', 'xp_earned',
+    'sets_created', 'perfect_reviews', 'friends_count',
+)
+
+
+def _quoted(values: tuple[str, ...]) -> str:
+    return ", ".join(f"'{v}'" for v in values)
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'xp_events', 'event_type',
+        type_=sa.String(32),
+        postgresql_using='event_type::text',
+    )
+    op.create_check_constraint(
+        'ck_xp_events_event_type', 'xp_events',
+        f"event_type IN ({_quoted(XP_EVENT_TYPES)})",
+    )
+    op.alter_column(
+        'achievements', 'condition_type',
+        type_=sa.String(32),
+        postgresql_using='condition_type::text',
+    )
+    op.create_check_constraint(
+        'ck_achievements_condition_type', 'achievements',
+        f"condition_type IN ({_quoted(ACHIEVEMENT_CONDITIONS)})",
+    )
+    op.execute('DROP TYPE xp_event_type_enum')
+    op.execute('DROP TYPE achievement_condition_enum')
+
+
+def downgrade() -> None:
+    op.execute(
+        f"CREATE TYPE xp_event_type_enum AS ENUM ({_quoted(XP_EVENT_TYPES)})"
+    )
+    op.execute(
+        f"CREATE TYPE achievement_condition_enum AS ENUM ({_quoted(ACHIEVEMENT_CONDITIONS)})"
+    )
+    op.drop_constraint('ck_xp_events_event_type', 'xp_events')
+    op.alter_column(
+        'xp_events', 'event_type',
+        type_=sa.Enum(name='xp_event_type_enum'),
+        postgresql_using='event_type::xp_event_type_enum',
+    )
+    op.drop_constraint('ck_achievements_condition_type', 'achievements')
+    op.alter_column(
+        'achievements', 'condition_type',
+        type_=sa.Enum(name='achievement_condition_enum'),
+        postgresql_using='condition_type::achievement_condition_enum',
+    )
@@ -0,0 +1,50 @@
+"""compact user_card_progress column types
+
+Revision ID: f3a4b5c6d7e8
+Revises: e2f3a4b5c6d7
+Create Date: 2026-08-31 12:00:00.000000
+
+user_card_progress grows as users x cards; float4 ease and int2
+scheduling fields shrink every tuple, so due-card scans touch fewer
+heap pages. SM-2 needs neither FP64 precision nor 32-bit intervals.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a4b5c6d7e8'
+down_revision: Union[str, Sequence[str], None] = 'e2f3a4b5c6d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'user_card_progress', 'ease_factor',
+        type_=sa.REAL(), postgresql_using='ease_factor::real',
+    )
+    op.alter_column(
+        'user_card_progress', 'interval',
+        type_=sa.SmallInteger(), postgresql_using='interval::smallint',
+    )
+    op.alter_column(
+        'user_card_progress', 'repetitions',
+        type_=sa.SmallInteger(), postgresql_using='repetitions::smallint',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'user_card_progress', 'repetitions',
+        type_=sa.Integer(), postgresql_using='repetitions::integer',
+    )
+    op.alter_column(
+        'user_card_progress', 'interval',
+        type_=sa.Integer(), postgresql_using='interval::integer',
+    )
+    op.alter_column(
+        'user_card_progress', 'ease_factor',
+        type_=sa.Float(), postgresql_using='ease_factor::double precision',
+    )
@@ -0,0 +1,45 @@
+"""add composite indexes for keyset pagination
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-08-31 11:00:00.000000
+
+The list endpoints now paginate by (created_at, id) / (order_index,
+created_at, id) seeks instead of OFFSET; these indexes make each page an
+index range scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7a8b9c0d1e2'
+down_revision: Union[str, Sequence[str], None] = 'e6f7a8b9c0d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_card_sets_user_created', 'card_sets',
+        ['user_id', 'created_at', 'id'],
+    )
+    op.create_index(
+        'ix_card_sets_public_created', 'card_sets',
+        ['created_at', 'id'],
+        postgresql_where=sa.text('is_public'),
+    )
+    # Wider index subsumes the old single-column one
+    op.create_index(
+        'ix_cards_set_order', 'cards',
+        ['card_set_id', 'order_index', 'created_at', 'id'],
+    )
+    op.drop_index('ix_cards_card_set_id', table_name='cards')
+
+
+def downgrade() -> None:
+    op.create_index('ix_cards_card_set_id', 'cards', ['card_set_id'])
+    op.drop_index('ix_cards_set_order', table_name='cards')
+    op.drop_index('ix_card_sets_public_created', table_name='card_sets')
+    op.drop_index('ix_card_sets_user_created', table_name='card_sets')
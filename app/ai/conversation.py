@@ -1,13 +1,16 @@
-import json
+import asyncio
+import contextlib
+import functools
 import logging
 from collections.abc import AsyncIterator
+from itertools import islice
 
+import orjson
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
-from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_mistralai import ChatMistralAI
 
-from app.ai.scenarios import ScenarioConfig
+from app.ai.scenarios import SCENARIOS, ScenarioConfig, ScenarioType
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -23,8 +26,16 @@ LEVEL_GUIDELINES = {
 
 MAX_CONTEXT_MESSAGES = 20
 
+# Streaming chunks are coalesced before being yielded so long replies don't
+# turn into one ASGI send event per model token.
+STREAM_FLUSH_MAX_CHARS = 32
+STREAM_FLUSH_INTERVAL_SECONDS = 0.02
 
+
+@functools.lru_cache(maxsize=None)
 def _build_conversation_llm() -> ChatMistralAI:
+    # Cached so repeated turns reuse one client (and its connection pool)
+    # instead of reconstructing it per request.
     return ChatMistralAI(
         model=settings.MISTRAL_MODEL,
         api_key=settings.MISTRAL_API_KEY,
@@ -33,6 +44,7 @@ def _build_conversation_llm() -> ChatMistralAI:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def _build_grammar_llm() -> ChatMistralAI:
     return ChatMistralAI(
         model=settings.MISTRAL_MODEL,
@@ -41,7 +53,11 @@ def _build_grammar_llm() -> ChatMistralAI:
     )
 
 
-def _build_system_message(scenario: ScenarioConfig, level: str) -> str:
+@functools.lru_cache(maxsize=64)
+def _build_system_message(scenario_type: ScenarioType, level: str) -> str:
+    # Only len(SCENARIOS) x len(LEVEL_GUIDELINES) distinct prompts exist,
+    # so cache them instead of re-formatting on every turn.
+    scenario = SCENARIOS[scenario_type]
     level_guide = LEVEL_GUIDELINES.get(level, LEVEL_GUIDELINES["B1"])
     return (
         f"{scenario.system_context}\n\n"
@@ -59,19 +75,19 @@ def _build_langchain_messages(
     system_prompt: str,
     messages: list[dict],
 ) -> list[SystemMessage | HumanMessage | AIMessage]:
+    # Truncate to last N messages for context window management; islice
+    # walks the tail in place instead of allocating an intermediate list.
+    start = max(0, len(messages) - MAX_CONTEXT_MESSAGES)
     lc_messages: list[SystemMessage | HumanMessage | AIMessage] = [
         SystemMessage(content=system_prompt),
     ]
-
-    # Truncate to last N messages for context window management
-    recent = messages[-MAX_CONTEXT_MESSAGES:] if len(messages) > MAX_CONTEXT_MESSAGES else messages
-
-    for msg in recent:
-        if msg["role"] == "user":
-            lc_messages.append(HumanMessage(content=msg["content"]))
-        elif msg["role"] == "assistant":
-            lc_messages.append(AIMessage(content=msg["content"]))
-
+    lc_messages.extend(
+        HumanMessage(content=msg["content"])
+        if msg["role"] == "user"
+        else AIMessage(content=msg["content"])
+        for msg in islice(messages, start, None)
+        if msg["role"] in ("user", "assistant")
+    )
     return lc_messages
 
 
@@ -80,14 +96,56 @@ async def generate_conversation_reply_stream(
     messages: list[dict],
     level: str,
 ) -> AsyncIterator[str]:
-    """Stream AI conversation reply as text chunks."""
+    """Stream AI conversation reply as buffered text chunks.
+
+    Chunks are flushed once STREAM_FLUSH_MAX_CHARS accumulate or after
+    STREAM_FLUSH_INTERVAL_SECONDS of model silence, whichever comes first.
+    """
     llm = _build_conversation_llm()
-    system_prompt = _build_system_message(scenario, level)
+    system_prompt = _build_system_message(scenario.type, level)
     lc_messages = _build_langchain_messages(system_prompt, messages)
 
-    async for chunk in llm.astream(lc_messages):
-        if chunk.content:
-            yield chunk.content
+    stream = llm.astream(lc_messages).__aiter__()
+    buffer: list[str] = []
+    buffered_chars = 0
+    # Shield the pending __anext__ so a flush timeout doesn't cancel the
+    # underlying model stream; the same task is awaited again next loop.
+    pending = asyncio.ensure_future(stream.__anext__())
+    try:
+        while True:
+            try:
+                chunk = await asyncio.wait_for(
+                    asyncio.shield(pending),
+                    timeout=STREAM_FLUSH_INTERVAL_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                if buffer:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffered_chars = 0
+                continue
+            except StopAsyncIteration:
+                break
+            pending = asyncio.ensure_future(stream.__anext__())
+            if chunk.content:
+                buffer.append(chunk.content)
+                buffered_chars += len(chunk.content)
+                if buffered_chars >= STREAM_FLUSH_MAX_CHARS:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffered_chars = 0
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        # On early close (client disconnect throws GeneratorExit at the
+        # current yield) the shielded task would keep the model stream
+        # running to completion in the background; reap it and close the
+        # underlying stream explicitly.
+        if not pending.done():
+            pending.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await pending
+        await stream.aclose()
 
 
 GRAMMAR_CHECK_PROMPT = """\
@@ -113,6 +171,22 @@ If there are no errors, return: {{"corrections": [], "suggestions": []}}
 """
 
 
+def _parse_json_content(content: str) -> dict:
+    """Parse LLM JSON output with orjson, tolerating markdown code fences."""
+    text = content.strip()
+    if text.startswith("```"):
+        text = text[text.index("\n") + 1:]
+        if text.endswith("```"):
+            text = text[:-3]
+    return orjson.loads(text)
+
+
+# Built once at import; ChatPromptTemplate is immutable
+_GRAMMAR_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", GRAMMAR_CHECK_PROMPT),
+])
+
+
 async def check_grammar(
     user_message: str,
     last_ai_message: str,
@@ -122,18 +196,15 @@ async def check_grammar(
     """Check grammar and return (corrections, suggestions). Gracefully returns empty on error."""
     try:
         llm = _build_grammar_llm()
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", GRAMMAR_CHECK_PROMPT),
-        ])
-        parser = JsonOutputParser()
-        chain = prompt | llm | parser
+        chain = _GRAMMAR_PROMPT | llm
 
-        result = await chain.ainvoke({
+        response = await chain.ainvoke({
             "level": level,
             "native_language": native_language,
             "user_message": user_message,
             "last_ai_message": last_ai_message or "",
         })
+        result = _parse_json_content(response.content)
 
         corrections = result.get("corrections", [])
         suggestions = result.get("suggestions", [])
@@ -166,6 +237,12 @@ Return ONLY valid JSON, no extra text.
 """
 
 
+# Built once at import; ChatPromptTemplate is immutable
+_FEEDBACK_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", FEEDBACK_PROMPT),
+])
+
+
 async def generate_conversation_feedback(
     messages: list[dict],
     level: str,
@@ -173,39 +250,30 @@ async def generate_conversation_feedback(
 ) -> dict:
     """Generate end-of-conversation feedback."""
     try:
-        # Build conversation text
-        conversation_lines = []
-        errors_summary_parts = []
-        total_errors = 0
-
-        for msg in messages:
-            role_label = "Student" if msg["role"] == "user" else "AI"
-            conversation_lines.append(f"{role_label}: {msg['content']}")
-
-            corrections = msg.get("corrections")
-            if corrections:
-                total_errors += len(corrections)
-                for c in corrections:
-                    errors_summary_parts.append(
-                        f"- \"{c['original']}\" → \"{c['corrected']}\" ({c.get('explanation', '')})"
-                    )
-
-        conversation_text = "\n".join(conversation_lines)
-        errors_summary = "\n".join(errors_summary_parts) if errors_summary_parts else "No errors found."
+        # Build conversation text and error summary in single passes
+        conversation_text = "\n".join(
+            f"{'Student' if msg['role'] == 'user' else 'AI'}: {msg['content']}"
+            for msg in messages
+        )
+        all_corrections = [
+            c for msg in messages for c in (msg.get("corrections") or ())
+        ]
+        total_errors = len(all_corrections)
+        errors_summary = "\n".join(
+            f"- \"{c['original']}\" → \"{c['corrected']}\" ({c.get('explanation', '')})"
+            for c in all_corrections
+        ) or "No errors found."
 
         llm = _build_grammar_llm()
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", FEEDBACK_PROMPT),
-        ])
-        parser = JsonOutputParser()
-        chain = prompt | llm | parser
+        chain = _FEEDBACK_PROMPT | llm
 
-        result = await chain.ainvoke({
+        response = await chain.ainvoke({
             "level": level,
             "native_language": native_language,
             "conversation_text": conversation_text,
             "errors_summary": errors_summary,
         })
+        result = _parse_json_content(response.content)
 
         result["total_errors"] = total_errors
         return result
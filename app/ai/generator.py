@@ -1,6 +1,9 @@
+import functools
 import json
 import logging
 
+import msgspec
+
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_mistralai import ChatMistralAI
@@ -37,7 +40,10 @@ Return ONLY a JSON array of objects, no extra text. Example:
 """
 
 
+@functools.lru_cache(maxsize=None)
 def _build_llm() -> ChatMistralAI:
+    # Cached so repeated generations reuse one client (and its connection
+    # pool) instead of reconstructing it per request.
     return ChatMistralAI(
         model=settings.MISTRAL_MODEL,
         api_key=settings.MISTRAL_API_KEY,
@@ -45,11 +51,11 @@ def _build_llm() -> ChatMistralAI:
     )
 
 
-def _build_prompt() -> ChatPromptTemplate:
-    return ChatPromptTemplate.from_messages([
-        ("system", SYSTEM_PROMPT),
-        ("human", "Generate {count} flashcards about \"{topic}\" for level {level}."),
-    ])
+# Built once at import; ChatPromptTemplate is immutable
+_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SYSTEM_PROMPT),
+    ("human", "Generate {count} flashcards about \"{topic}\" for level {level}."),
+])
 
 
 async def generate_cards(
@@ -68,10 +74,9 @@ async def generate_cards(
         )
 
     llm = _build_llm()
-    prompt = _build_prompt()
     parser = JsonOutputParser()
 
-    chain = prompt | llm | parser
+    chain = _PROMPT | llm | parser
 
     logger.info("Generating %d cards for topic=%s, level=%s", count, topic, level)
 
@@ -83,7 +88,7 @@ async def generate_cards(
         "native_language": native_language,
     })
 
-    cards = [GeneratedCardItem(**item) for item in result]
+    cards = msgspec.convert(result, list[GeneratedCardItem], strict=False)
 
     # Trim to requested count in case LLM returns more
     return cards[:count]
@@ -1,6 +1,6 @@
+import dataclasses
 import enum
-
-from pydantic import BaseModel
+from types import MappingProxyType
 
 
 class ScenarioType(str, enum.Enum):
@@ -15,7 +15,10 @@ class ScenarioType(str, enum.Enum):
     free_conversation = "free_conversation"
 
 
-class ScenarioConfig(BaseModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class ScenarioConfig:
+    # Static config, not user input — a frozen slots dataclass gives plain
+    # attribute access on the hot prompt-building path.
     type: ScenarioType
     title: str
     description: str
@@ -25,7 +28,7 @@ class ScenarioConfig(BaseModel):
     suggested_turns: int
 
 
-SCENARIOS: dict[ScenarioType, ScenarioConfig] = {
+SCENARIOS: MappingProxyType[ScenarioType, ScenarioConfig] = MappingProxyType({
     ScenarioType.airport: ScenarioConfig(
         type=ScenarioType.airport,
         title="At the Airport",
@@ -107,4 +110,4 @@ SCENARIOS: dict[ScenarioType, ScenarioConfig] = {
         system_context="You are a friendly and curious conversation partner. Follow the user's lead on topics. Ask follow-up questions to keep the conversation flowing naturally. Be engaging and supportive.",
         suggested_turns=20,
     ),
-}
+})
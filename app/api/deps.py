@@ -1,49 +1,128 @@
+import asyncio
+import hashlib
+import uuid
+from typing import NamedTuple
+
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError
+from jwt import PyJWTError
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import decode_token
+from app.core.token_cache import decode_token_cached, is_token_revoked
 from app.database import get_db
 from app.models.user import User
-from app.services.auth_service import get_user_by_id
+from app.services.user_cache import get_cached_user, invalidate_user
 
 bearer_scheme = HTTPBearer()
 
+# Short-lived per-process cache of authenticated users, keyed by a digest of
+# the access token. Saves the Redis round-trip on hot endpoints; the TTL is
+# kept short so profile and permission changes propagate quickly.
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=10)
+_user_cache_lock = asyncio.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+async def invalidate_cached_user(user_id: uuid.UUID, redis: Redis | None = None) -> None:
+    """Drop cached entries for a user after profile or permission changes."""
+    async with _user_cache_lock:
+        stale = [key for key, user in _user_cache.items() if user.id == user_id]
+        for key in stale:
+            del _user_cache[key]
+    if redis is not None:
+        await invalidate_user(redis, user_id)
+
 
 async def get_redis(request: Request) -> Redis:
     return request.app.state.redis
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-    db: AsyncSession = Depends(get_db),
+def _ensure_active(user: User) -> None:
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Inactive user account",
+        )
+
+
+async def _resolve_user(
+    credentials: HTTPAuthorizationCredentials,
+    db: AsyncSession,
+    redis: Redis,
 ) -> User:
+    cache_key = _token_cache_key(credentials.credentials)
+    async with _user_cache_lock:
+        cached = _user_cache.get(cache_key)
+    if cached is not None:
+        _ensure_active(cached)
+        # Re-attach the snapshot so updates in this request still persist
+        return await db.merge(cached, load=False)
+
     try:
-        user_id = decode_token(credentials.credentials, expected_type="access")
-    except JWTError:
+        user_id = decode_token_cached(credentials.credentials, expected_type="access")
+    except PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired access token",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = await get_user_by_id(db, user_id)
-    if user is None:
+    # Revocation gate rides the cache-miss path only: the process cache
+    # bounds how long a revoked token can keep hitting (its 10s TTL),
+    # and the hot path stays free of extra Redis round-trips
+    if await is_token_revoked(redis, credentials.credentials):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
+            detail="Token has been revoked",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    if not user.is_active:
+
+    user = await get_cached_user(redis, db, user_id)
+    if user is None:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Inactive user account",
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
         )
+    _ensure_active(user)
+    async with _user_cache_lock:
+        _user_cache[cache_key] = user
     return user
 
 
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+) -> User:
+    return await _resolve_user(credentials, db, redis)
+
+
+class AuthContext(NamedTuple):
+    """Authenticated user plus the request's DB session.
+
+    Resolving both through one dependency saves a second pass through
+    FastAPI's dependency graph on every authenticated route.
+    """
+
+    user: User
+    db: AsyncSession
+
+
+async def get_auth_context(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+) -> AuthContext:
+    user = await _resolve_user(credentials, db, redis)
+    return AuthContext(user=user, db=db)
+
+
 async def get_admin_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
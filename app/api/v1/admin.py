@@ -1,10 +1,12 @@
 import uuid
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_admin_user, get_db
+from app.api.deps import get_admin_user, get_db, get_redis, invalidate_cached_user
 from app.models.user import User
+from app.schemas import _fast
 from app.schemas.admin import (
     AdminUserResponse,
     AdminUserUpdateRequest,
@@ -16,24 +18,45 @@ from app.services import admin_service
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+# Platform stats move slowly; a short Redis TTL absorbs repeat dashboard
+# views without a visible staleness window
+_STATS_CACHE_KEY = "admin:platform_stats"
+_STATS_CACHE_TTL = 45
+
+# Responses are encoded once with the shared msgspec encoder and returned
+# as raw Response objects, skipping FastAPI's jsonable_encoder and the
+# response_model re-validation pass; the pydantic schemas stay on the
+# decorators so the OpenAPI spec is unchanged.
+
 
 @router.get("/stats", response_model=PlatformStatsResponse)
 async def get_platform_stats(
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
     _admin: User = Depends(get_admin_user),
-) -> PlatformStatsResponse:
-    return await admin_service.get_platform_stats(db)
+) -> Response:
+    cached = await redis.get(_STATS_CACHE_KEY)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    stats = await admin_service.get_platform_stats(db)
+    body = _fast.ENCODER.encode(stats)
+    await redis.set(_STATS_CACHE_KEY, body, ex=_STATS_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/users", response_model=PaginatedAdminUserResponse)
 async def list_users(
-    skip: int = Query(0, ge=0),
+    after: str | None = Query(None, description="Keyset cursor from next_cursor"),
     limit: int = Query(20, ge=1, le=100),
     search: str | None = Query(None, max_length=100),
     db: AsyncSession = Depends(get_db),
     _admin: User = Depends(get_admin_user),
-) -> PaginatedAdminUserResponse:
-    return await admin_service.list_users(db, skip, limit, search)
+) -> Response:
+    page = await admin_service.list_users(db, after, limit, search)
+    return Response(
+        content=_fast.ENCODER.encode(page), media_type="application/json"
+    )
 
 
 @router.patch("/users/{user_id}", response_model=AdminUserResponse)
@@ -41,9 +64,14 @@ async def update_user(
     user_id: uuid.UUID,
     body: AdminUserUpdateRequest,
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
     _admin: User = Depends(get_admin_user),
-) -> AdminUserResponse:
-    return await admin_service.update_user_admin(db, user_id, body)
+) -> Response:
+    updated = await admin_service.update_user_admin(db, user_id, body)
+    await invalidate_cached_user(user_id, redis)
+    return Response(
+        content=_fast.ENCODER.encode(updated), media_type="application/json"
+    )
 
 
 @router.delete(
@@ -60,13 +88,16 @@ async def delete_user(
 
 @router.get("/card-sets", response_model=PaginatedAdminCardSetResponse)
 async def list_public_card_sets(
-    skip: int = Query(0, ge=0),
+    after: str | None = Query(None, description="Keyset cursor from next_cursor"),
     limit: int = Query(20, ge=1, le=100),
     search: str | None = Query(None, max_length=100),
     db: AsyncSession = Depends(get_db),
     _admin: User = Depends(get_admin_user),
-) -> PaginatedAdminCardSetResponse:
-    return await admin_service.list_public_card_sets(db, skip, limit, search)
+) -> Response:
+    page = await admin_service.list_public_card_sets(db, after, limit, search)
+    return Response(
+        content=_fast.ENCODER.encode(page), media_type="application/json"
+    )
 
 
 @router.delete(
@@ -1,10 +1,7 @@
 from fastapi import APIRouter, Depends
 from redis.asyncio import Redis
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_redis
-from app.database import get_db
-from app.models.user import User
+from app.api.deps import AuthContext, get_auth_context, get_redis
 from app.schemas.ai import GenerateCardsRequest, GenerateCardsResponse
 from app.services.ai_service import generate_card_set
 
@@ -18,10 +15,10 @@ router = APIRouter(prefix="/ai", tags=["ai"])
 )
 async def generate_cards_endpoint(
     data: GenerateCardsRequest,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
     redis: Redis = Depends(get_redis),
 ):
+    current_user, db = auth
     card_set = await generate_card_set(db, redis, current_user, data)
     await db.commit()
     return GenerateCardsResponse(
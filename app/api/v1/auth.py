@@ -1,5 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, Cookie, status
-from jose import JWTError
+import logging
+import uuid
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Cookie,
+    Depends,
+    HTTPException,
+    Response,
+    status,
+)
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jwt import PyJWTError
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -9,9 +22,14 @@ from app.core.security import (
     create_refresh_token,
     decode_token,
 )
+from app.core.token_cache import decode_token_cached, revoke_token
 from app.database import get_db
-from app.api.deps import get_current_user
-from app.models.user import User
+from app.api.deps import (
+    AuthContext,
+    get_auth_context,
+    get_redis,
+    invalidate_cached_user,
+)
 from app.schemas.user import (
     PasswordResetConfirmSchema,
     PasswordResetRequestSchema,
@@ -22,6 +40,7 @@ from app.schemas.user import (
     UserResponse,
 )
 from app.services.limits_service import get_usage_limits
+from app.services.user_cache import get_cached_user
 from app.services.auth_service import (
     authenticate_user,
     create_user,
@@ -30,11 +49,17 @@ from app.services.auth_service import (
     update_user_password,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 REFRESH_COOKIE_KEY = "refresh_token"
 REFRESH_COOKIE_PATH = "/api/v1/auth"
 
+# Logout must work even with an expired or missing access token, so it
+# takes the bearer credentials optionally instead of through deps
+_optional_bearer = HTTPBearer(auto_error=False)
+
 
 def _set_refresh_cookie(response: Response, token: str) -> None:
     response.set_cookie(
@@ -104,7 +129,7 @@ async def login(
     refresh_token = create_refresh_token(user.id)
     _set_refresh_cookie(response, refresh_token)
 
-    return TokenResponse(access_token=access_token)
+    return TokenResponse.model_construct(access_token=access_token)
 
 
 @router.post("/refresh", response_model=TokenResponse)
@@ -112,6 +137,7 @@ async def refresh(
     response: Response,
     refresh_token: str | None = Cookie(default=None),
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
     if refresh_token is None:
         raise HTTPException(
@@ -120,15 +146,15 @@ async def refresh(
         )
 
     try:
-        user_id = decode_token(refresh_token, expected_type="refresh")
-    except JWTError:
+        user_id = decode_token_cached(refresh_token, expected_type="refresh")
+    except PyJWTError:
         _clear_refresh_cookie(response)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired refresh token",
         )
 
-    user = await get_user_by_id(db, user_id)
+    user = await get_cached_user(redis, db, user_id)
     if user is None or not user.is_active:
         _clear_refresh_cookie(response)
         raise HTTPException(
@@ -140,17 +166,36 @@ async def refresh(
     new_refresh = create_refresh_token(user.id)
     _set_refresh_cookie(response, new_refresh)
 
-    return TokenResponse(access_token=new_access)
+    return TokenResponse.model_construct(access_token=new_access)
 
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
-async def logout(response: Response):
+async def logout(
+    response: Response,
+    credentials: HTTPAuthorizationCredentials | None = Depends(_optional_bearer),
+    redis: Redis = Depends(get_redis),
+):
+    # Revoke the presented access token cluster-wide so it cannot be
+    # replayed for its remaining lifetime
+    if credentials is not None:
+        await revoke_token(redis, credentials.credentials)
     _clear_refresh_cookie(response)
 
 
+def _send_password_reset_email(user_id: uuid.UUID) -> None:
+    """Generate the reset token off the request path.
+
+    Email delivery is not wired up yet; this is where the mailer call
+    goes once it is.
+    """
+    create_password_reset_token(user_id)
+    logger.info("Password reset token issued for user %s", user_id)
+
+
 @router.post("/password-reset/request")
 async def password_reset_request(
     data: PasswordResetRequestSchema,
+    background: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     user = await get_user_by_email(db, data.email)
@@ -159,9 +204,12 @@ async def password_reset_request(
     result: dict = {"message": "If this email exists, a reset link has been sent"}
 
     if user is not None:
-        token = create_password_reset_token(user.id)
         if settings.DEBUG:
-            result["reset_token"] = token
+            # Dev flow reads the token from the response, so it must be
+            # generated inline
+            result["reset_token"] = create_password_reset_token(user.id)
+        else:
+            background.add_task(_send_password_reset_email, user.id)
 
     return result
 
@@ -170,10 +218,11 @@ async def password_reset_request(
 async def password_reset_confirm(
     data: PasswordResetConfirmSchema,
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
     try:
         user_id = decode_token(data.token, expected_type="password_reset")
-    except JWTError:
+    except PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired reset token",
@@ -187,12 +236,13 @@ async def password_reset_confirm(
         )
 
     await update_user_password(db, user, data.new_password)
+    await invalidate_cached_user(user.id, redis)
     return {"message": "Password has been reset successfully"}
 
 
 @router.get("/usage-limits", response_model=UsageLimitsResponse)
 async def usage_limits(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     return await get_usage_limits(db, current_user)
@@ -1,12 +1,15 @@
 import uuid
+from collections.abc import AsyncIterator
 
-from fastapi import APIRouter, Depends, File, Query, UploadFile, status
-from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
+from fastapi import APIRouter, Depends, File, Query, Response, UploadFile, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
-from app.api.deps import get_current_user
-from app.database import get_db
+from app.api.deps import AuthContext, get_auth_context
+from app.core.pagination import decode_created_cursor, encode_cursor
 from app.models.card import CardType
-from app.models.user import LanguageLevel, User
+from app.models.user import LanguageLevel
+from app.schemas import _fast
 from app.schemas.card import (
     CardBulkCreate,
     CardBulkResponse,
@@ -32,13 +35,13 @@ from app.services.card_service import (
     get_card_set_or_public,
     import_cards_from_file,
     list_cards,
-    list_public_card_sets,
     list_user_card_sets,
+    stream_public_card_sets,
     update_card,
     update_card_set,
 )
 
-router = APIRouter(prefix="/card-sets", tags=["card-sets"])
+router = APIRouter(prefix="/card-sets", tags=["card-sets"], default_response_class=ORJSONResponse)
 
 
 # --- CardSet endpoints ---
@@ -46,52 +49,84 @@ router = APIRouter(prefix="/card-sets", tags=["card-sets"])
 @router.post("", response_model=CardSetResponse, status_code=status.HTTP_201_CREATED)
 async def create_card_set_endpoint(
     data: CardSetCreate,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     return await create_card_set(db, data, current_user)
 
 
 @router.get("", response_model=PaginatedCardSetResponse)
 async def list_my_card_sets(
-    skip: int = Query(0, ge=0),
+    after: str | None = Query(None, description="Keyset cursor from next_cursor"),
     limit: int = Query(20, ge=1, le=100),
     q: str | None = Query(None, max_length=200),
     category: str | None = None,
     difficulty_level: LanguageLevel | None = None,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    items, total = await list_user_card_sets(
-        db, current_user, skip=skip, limit=limit, q=q,
+    current_user, db = auth
+    items, has_more, next_cursor = await list_user_card_sets(
+        db, current_user, after=after, limit=limit, q=q,
         category=category, difficulty_level=difficulty_level,
     )
-    return PaginatedCardSetResponse(items=items, total=total, skip=skip, limit=limit)
+    # Serialize once with orjson instead of re-validating through response_model
+    page = PaginatedCardSetResponse(
+        items=items, limit=limit, has_more=has_more, next_cursor=next_cursor,
+    )
+    return ORJSONResponse(page.model_dump(mode="json"))
 
 
 @router.get("/public", response_model=PaginatedCardSetResponse)
 async def list_public_card_sets_endpoint(
-    skip: int = Query(0, ge=0),
+    after: str | None = Query(None, description="Keyset cursor from next_cursor"),
     limit: int = Query(20, ge=1, le=100),
     q: str | None = Query(None, max_length=200),
     category: str | None = None,
     difficulty_level: LanguageLevel | None = None,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    items, total = await list_public_card_sets(
-        db, skip=skip, limit=limit, q=q,
-        category=category, difficulty_level=difficulty_level,
-    )
-    return PaginatedCardSetResponse(items=items, total=total, skip=skip, limit=limit)
+    current_user, db = auth
+
+    # Validate the cursor before the 200 status line goes out; a bad
+    # cursor raised inside the generator could only break the stream
+    cursor = decode_created_cursor(after) if after else None
+
+    async def body() -> AsyncIterator[bytes]:
+        # Serialize each row as it arrives from stream_scalars instead of
+        # materializing the whole page before responding
+        yield b'{"items":['
+        count = 0
+        has_more = False
+        last: CardSetResponse | None = None
+        async for card_set in stream_public_card_sets(
+            db, after=cursor, limit=limit, q=q,
+            category=category, difficulty_level=difficulty_level,
+        ):
+            count += 1
+            if count > limit:
+                has_more = True
+                break
+            if count > 1:
+                yield b","
+            last = CardSetResponse.model_validate(card_set)
+            yield orjson.dumps(last.model_dump(mode="json"))
+        next_cursor = (
+            encode_cursor(last.created_at.isoformat(), last.id)
+            if has_more and last is not None
+            else None
+        )
+        tail = {"limit": limit, "has_more": has_more, "next_cursor": next_cursor}
+        yield b"]," + orjson.dumps(tail)[1:]
+
+    return StreamingResponse(body(), media_type="application/json")
 
 
 @router.get("/{set_id}", response_model=CardSetDetailResponse)
 async def get_card_set_detail(
     set_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     return await get_card_set_or_public(db, set_id, current_user)
 
 
@@ -99,9 +134,9 @@ async def get_card_set_detail(
 async def update_card_set_endpoint(
     set_id: uuid.UUID,
     data: CardSetUpdate,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     card_set = await get_card_set_for_owner(db, set_id, current_user)
     return await update_card_set(db, card_set, data)
 
@@ -109,9 +144,9 @@ async def update_card_set_endpoint(
 @router.delete("/{set_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_card_set_endpoint(
     set_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     card_set = await get_card_set_for_owner(db, set_id, current_user)
     await delete_card_set(db, card_set)
 
@@ -124,9 +159,9 @@ async def delete_card_set_endpoint(
 async def create_card_endpoint(
     set_id: uuid.UUID,
     data: CardCreate,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     card_set = await get_card_set_for_owner(db, set_id, current_user)
     return await create_card(db, card_set, data, current_user)
 
@@ -134,27 +169,51 @@ async def create_card_endpoint(
 @router.get("/{set_id}/cards", response_model=PaginatedCardResponse)
 async def list_cards_endpoint(
     set_id: uuid.UUID,
-    skip: int = Query(0, ge=0),
+    after: str | None = Query(None, description="Keyset cursor from next_cursor"),
     limit: int = Query(50, ge=1, le=200),
     q: str | None = Query(None, max_length=200),
     card_type: CardType | None = None,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     card_set = await get_card_set_or_public(db, set_id, current_user)
-    items, total = await list_cards(
-        db, card_set, skip=skip, limit=limit, q=q, card_type=card_type,
+    items, has_more, next_cursor = await list_cards(
+        db, card_set, after=after, limit=limit, q=q, card_type=card_type,
+    )
+    # Hot path: per-row msgspec structs and one encode, no pydantic
+    # validation over a page of up to 200 cards
+    page = _fast.PaginatedCardResponse(
+        items=[
+            _fast.CardResponse(
+                id=card.id,
+                card_set_id=card.card_set_id,
+                front_text=card.front_text,
+                back_text=card.back_text,
+                example_sentence=card.example_sentence,
+                image_url=card.image_url,
+                audio_url=card.audio_url,
+                card_type=card.card_type,
+                order_index=card.order_index,
+                created_at=card.created_at,
+            )
+            for card in items
+        ],
+        limit=limit,
+        has_more=has_more,
+        next_cursor=next_cursor,
+    )
+    return Response(
+        content=_fast.ENCODER.encode(page), media_type="application/json"
     )
-    return PaginatedCardResponse(items=items, total=total, skip=skip, limit=limit)
 
 
 @router.get("/{set_id}/cards/{card_id}", response_model=CardResponse)
 async def get_card_endpoint(
     set_id: uuid.UUID,
     card_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     card_set = await get_card_set_or_public(db, set_id, current_user)
     return await get_card(db, card_set, card_id)
 
@@ -164,9 +223,9 @@ async def update_card_endpoint(
     set_id: uuid.UUID,
     card_id: uuid.UUID,
     data: CardUpdate,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     card_set = await get_card_set_for_owner(db, set_id, current_user)
     card = await get_card(db, card_set, card_id)
     return await update_card(db, card, data)
@@ -176,9 +235,9 @@ async def update_card_endpoint(
 async def delete_card_endpoint(
     set_id: uuid.UUID,
     card_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     card_set = await get_card_set_for_owner(db, set_id, current_user)
     card = await get_card(db, card_set, card_id)
     await delete_card(db, card)
@@ -192,9 +251,9 @@ async def delete_card_endpoint(
 async def bulk_create_cards_endpoint(
     set_id: uuid.UUID,
     data: CardBulkCreate,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     card_set = await get_card_set_for_owner(db, set_id, current_user)
     cards = await bulk_create_cards(db, card_set, data, current_user)
     return CardBulkResponse(created_count=len(cards), cards=cards)
@@ -208,9 +267,9 @@ async def bulk_create_cards_endpoint(
 async def import_cards_endpoint(
     set_id: uuid.UUID,
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     card_set = await get_card_set_for_owner(db, set_id, current_user)
     cards, skipped = await import_cards_from_file(db, card_set, file, current_user)
     return CardImportResponse(
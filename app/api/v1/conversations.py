@@ -1,20 +1,23 @@
-import json
+import hashlib
 import logging
 import uuid
 from collections.abc import AsyncIterator
 
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from redis.asyncio import Redis
-from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import TypeAdapter
 from sse_starlette.sse import EventSourceResponse
 
-from app.api.deps import get_current_user, get_redis
+from app.api.deps import AuthContext, get_auth_context, get_redis
 from app.ai.scenarios import SCENARIOS
-from app.database import async_session_factory, get_db
-from app.models.user import User
+from app.database import async_session_factory
+from app.schemas import _fast
 from app.schemas.conversation import (
     ConversationDetailResponse,
     ConversationEndResponse,
+    ConversationFeedbackStatusResponse,
     ConversationStartResponse,
     ConversationSummary,
     ScenarioListItem,
@@ -26,40 +29,59 @@ from app.services import conversation_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/conversations", tags=["conversations"])
+router = APIRouter(prefix="/conversations", tags=["conversations"], default_response_class=ORJSONResponse)
+
+# Dumps list responses straight to JSON bytes, bypassing the per-item
+# serialize_response loop
+_SCENARIO_LIST_ADAPTER = TypeAdapter(list[ScenarioListItem])
+
+# The scenario catalog is static, so its JSON is folded once at import
+_SCENARIOS_JSON = _SCENARIO_LIST_ADAPTER.dump_json([
+    ScenarioListItem(
+        type=config.type,
+        title=config.title,
+        description=config.description,
+        suggested_turns=config.suggested_turns,
+    )
+    for config in SCENARIOS.values()
+])
+
+
+_SCENARIOS_ETAG = f'"{hashlib.md5(_SCENARIOS_JSON).hexdigest()}"'
 
 
 @router.get("/scenarios", response_model=list[ScenarioListItem])
-async def list_scenarios():
+async def list_scenarios(request: Request):
     """List all available conversation scenarios."""
-    return [
-        ScenarioListItem(
-            type=config.type,
-            title=config.title,
-            description=config.description,
-            suggested_turns=config.suggested_turns,
-        )
-        for config in SCENARIOS.values()
-    ]
+    if request.headers.get("if-none-match") == _SCENARIOS_ETAG:
+        return Response(status_code=304, headers={"ETag": _SCENARIOS_ETAG})
+    return Response(
+        content=_SCENARIOS_JSON,
+        media_type="application/json",
+        headers={
+            "Cache-Control": "public, max-age=3600",
+            "ETag": _SCENARIOS_ETAG,
+        },
+    )
 
 
 @router.get("/weekly-status", response_model=WeeklyDialogueStatus)
 async def get_weekly_status(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
     """Get the user's weekly dialogue usage status."""
+    current_user, db = auth
     return await conversation_service.get_weekly_dialogue_status(db, current_user)
 
 
 @router.post("/start", response_model=ConversationStartResponse, status_code=201)
 async def start_conversation(
     data: StartConversationRequest,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
     redis: Redis = Depends(get_redis),
 ):
     """Start a new AI conversation with a selected scenario."""
+    current_user, db = auth
     return await conversation_service.start_conversation(
         db, redis, current_user, data.scenario,
     )
@@ -69,29 +91,26 @@ async def start_conversation(
 async def send_message(
     conversation_id: uuid.UUID,
     data: SendMessageRequest,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
     redis: Redis = Depends(get_redis),
 ):
-    """Send a message and receive SSE stream with corrections and AI reply."""
-    # Process user message (grammar check + store) within the request's DB session
-    corrections, suggestions, turn_number = await conversation_service.send_message(
+    """Send a message and receive SSE stream with AI reply and corrections.
+
+    The grammar check runs concurrently with reply streaming, so the
+    "corrections" event trails the token stream instead of preceding it.
+    """
+    current_user, db = auth
+    # Store user message and start the grammar check within the request's DB session
+    grammar_task, turn_number = await conversation_service.send_message(
         db, redis, current_user, conversation_id, data.message,
     )
-    # Commit user message before starting SSE stream
+    # Commit user message and hand the pooled connection back before the
+    # SSE stream starts; streaming can hold the response open for seconds
+    # and uses its own session below.
     await db.commit()
+    await db.close()
 
     async def event_generator() -> AsyncIterator[dict]:
-        # Emit corrections event
-        yield {
-            "event": "corrections",
-            "data": json.dumps({
-                "corrections": corrections,
-                "suggestions": suggestions,
-                "turn_number": turn_number,
-            }),
-        }
-
         # Stream AI reply using its own DB session (request session closes after return)
         full_reply_parts: list[str] = []
         try:
@@ -103,21 +122,38 @@ async def send_message(
                         full_reply_parts.append(chunk)
                         yield {"event": "token", "data": chunk}
 
+                    # Grammar check has been overlapping with the stream;
+                    # collect its results and persist them on the user message.
+                    corrections, suggestions = await grammar_task
+                    await conversation_service.attach_corrections(
+                        stream_db, conversation_id, current_user,
+                        corrections, suggestions,
+                    )
                     await stream_db.commit()
                 except Exception:
+                    grammar_task.cancel()
                     await stream_db.rollback()
                     raise
 
+            yield {
+                "event": "corrections",
+                "data": orjson.dumps({
+                    "corrections": corrections,
+                    "suggestions": suggestions,
+                    "turn_number": turn_number,
+                }).decode(),
+            }
+
             full_reply = "".join(full_reply_parts)
             yield {
                 "event": "done",
-                "data": json.dumps({"ai_message": full_reply}),
+                "data": orjson.dumps({"ai_message": full_reply}).decode(),
             }
         except Exception:
             logger.exception("Error during AI reply streaming")
             yield {
                 "event": "error",
-                "data": json.dumps({"detail": "Failed to generate AI reply"}),
+                "data": orjson.dumps({"detail": "Failed to generate AI reply"}).decode(),
             }
 
     return EventSourceResponse(event_generator())
@@ -126,29 +162,52 @@ async def send_message(
 @router.post("/{conversation_id}/end", response_model=ConversationEndResponse)
 async def end_conversation(
     conversation_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    """End a conversation and get feedback with XP reward."""
+    """End a conversation and award XP; feedback is generated in the background."""
+    current_user, db = auth
     return await conversation_service.end_conversation(db, current_user, conversation_id)
 
 
+@router.get("/{conversation_id}/feedback", response_model=ConversationFeedbackStatusResponse)
+async def get_conversation_feedback(
+    conversation_id: uuid.UUID,
+    auth: AuthContext = Depends(get_auth_context),
+):
+    """Poll for end-of-conversation feedback."""
+    current_user, db = auth
+    return await conversation_service.get_conversation_feedback(
+        db, current_user, conversation_id,
+    )
+
+
 @router.get("", response_model=list[ConversationSummary])
 async def list_conversations(
-    skip: int = Query(0, ge=0),
+    after: str | None = Query(None, description="Keyset cursor from X-Next-Cursor"),
     limit: int = Query(20, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
     """List user's conversation history (paginated, newest first)."""
-    return await conversation_service.list_conversations(db, current_user, skip, limit)
+    current_user, db = auth
+    summaries, next_cursor = await conversation_service.list_conversations(
+        db, current_user, after=after, limit=limit,
+    )
+    # The response body stays a bare list; the cursor rides in a header
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return Response(
+        content=_fast.ENCODER.encode(summaries),
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 @router.get("/{conversation_id}", response_model=ConversationDetailResponse)
 async def get_conversation(
     conversation_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
     """Get full conversation detail with messages and feedback."""
-    return await conversation_service.get_conversation(db, current_user, conversation_id)
+    current_user, db = auth
+    detail = await conversation_service.get_conversation(db, current_user, conversation_id)
+    # Serialize once with orjson instead of re-validating through response_model
+    return ORJSONResponse(detail.model_dump(mode="json"))
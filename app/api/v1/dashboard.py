@@ -1,9 +1,9 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+import hashlib
 
-from app.api.deps import get_current_user
-from app.database import get_db
-from app.models.user import User
+from fastapi import APIRouter, Depends, Request, Response
+
+from app.api.deps import AuthContext, get_auth_context
+from app.schemas import _fast
 from app.schemas.dashboard import DashboardResponse
 from app.services.dashboard_service import get_dashboard_data
 
@@ -12,7 +12,19 @@ router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 @router.get("", response_model=DashboardResponse)
 async def get_dashboard(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    return await get_dashboard_data(db, current_user)
+    current_user, db = auth
+    data = await get_dashboard_data(db, current_user)
+    # Content-addressed ETag: the queries still run, but a matching
+    # If-None-Match skips the response body on the wire
+    body = _fast.ENCODER.encode(data)
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
@@ -1,48 +1,70 @@
-from fastapi import APIRouter, Depends, Query
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
-from app.database import get_db
-from app.models.gamification import UserAchievement, UserGamification
-from app.models.user import User
+from app.api.deps import AuthContext, get_auth_context
+from app.models.gamification import UserGamification, XpEvent
+from app.schemas import _fast
 from app.schemas.gamification import (
     AchievementResponse,
     GamificationProfileResponse,
-    LeaderboardEntry,
     LeaderboardResponse,
 )
 from app.services.gamification_service import (
     get_leaderboard,
-    get_today_xp,
     get_user_achievements,
 )
 
-router = APIRouter(prefix="/gamification", tags=["gamification"])
+router = APIRouter(prefix="/gamification", tags=["gamification"], default_response_class=ORJSONResponse)
+
+# Dumps the achievements list straight to JSON bytes, bypassing the
+# per-item serialize_response loop
+_ACHIEVEMENT_LIST_ADAPTER = TypeAdapter(list[AchievementResponse])
 
 
 @router.get("/profile", response_model=GamificationProfileResponse)
 async def get_gamification_profile(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
+    # Today's XP rides along as a scalar subquery; the achievement count is
+    # a denormalized column on the row itself
+    today = datetime.now(timezone.utc).date()
+    today_xp_sq = (
+        select(func.coalesce(func.sum(XpEvent.xp_amount), 0))
+        .where(
+            XpEvent.user_id == current_user.id,
+            func.date(XpEvent.created_at) == today,
+        )
+        .scalar_subquery()
+    )
     result = await db.execute(
-        select(UserGamification).where(UserGamification.user_id == current_user.id)
+        select(UserGamification, today_xp_sq).where(
+            UserGamification.user_id == current_user.id
+        )
     )
-    gam = result.scalar_one_or_none()
-
-    today_xp = await get_today_xp(db, current_user.id)
+    row = result.one_or_none()
+    if row is not None:
+        gam, today_xp = row
+        achievements_unlocked = gam.achievements_unlocked
+    else:
+        # No gamification row yet means no XP events or achievements either
+        gam, achievements_unlocked, today_xp = None, 0, 0
 
-    # Count unlocked achievements
-    unlocked_result = await db.execute(
-        select(func.count())
-        .select_from(UserAchievement)
-        .where(UserAchievement.user_id == current_user.id)
-    )
-    achievements_unlocked = unlocked_result.scalar_one()
+    # Cheap version tag over the fields that can change; lets clients
+    # revalidate with If-None-Match and skip the body entirely
+    total_xp = gam.total_xp if gam else 0
+    etag = f'"{total_xp}-{today_xp}-{achievements_unlocked}-{current_user.daily_xp_goal}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
 
-    return GamificationProfileResponse(
-        total_xp=gam.total_xp if gam else 0,
+    # model_construct: values come straight from trusted DB columns
+    profile = GamificationProfileResponse.model_construct(
+        total_xp=total_xp,
         level=gam.level if gam else 1,
         league=gam.league if gam else "Bronze",
         current_streak=gam.current_streak if gam else 0,
@@ -51,28 +73,41 @@ async def get_gamification_profile(
         daily_xp_goal=current_user.daily_xp_goal,
         achievements_unlocked=achievements_unlocked,
     )
+    return ORJSONResponse(
+        profile.model_dump(mode="json"), headers={"ETag": etag},
+    )
 
 
 @router.get("/achievements", response_model=list[AchievementResponse])
 async def get_achievements(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    return await get_user_achievements(db, current_user.id)
+    current_user, db = auth
+    items = await get_user_achievements(db, current_user.id)
+    return Response(
+        content=_ACHIEVEMENT_LIST_ADAPTER.dump_json(items),
+        media_type="application/json",
+    )
 
 
 @router.get("/leaderboard", response_model=LeaderboardResponse)
 async def get_leaderboard_endpoint(
     period: str = Query("weekly", pattern="^(weekly|monthly|all_time)$"),
     limit: int = Query(50, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     entries, user_rank = await get_leaderboard(
         db, period, limit=limit, current_user_id=current_user.id,
     )
-    return LeaderboardResponse(
-        entries=[LeaderboardEntry(**e) for e in entries],
+    response = _fast.LeaderboardResponse(
+        entries=[_fast.LeaderboardEntry(**e) for e in entries],
         period=period,
         user_rank=user_rank,
     )
+    # msgspec structs encode in one C call with no validation pass; the
+    # pydantic LeaderboardResponse stays above only for OpenAPI
+    return Response(
+        content=_fast.ENCODER.encode(response),
+        media_type="application/json",
+    )
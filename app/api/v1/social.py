@@ -1,10 +1,10 @@
 import uuid
 
-from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
-from app.api.deps import get_current_user, get_db
-from app.models.user import User
+from app.api.deps import AuthContext, get_auth_context
 from app.schemas.social import (
     FriendProgressResponse,
     FriendResponse,
@@ -16,7 +16,13 @@ from app.schemas.social import (
 )
 from app.services import social_service
 
-router = APIRouter(prefix="/social", tags=["social"])
+router = APIRouter(prefix="/social", tags=["social"], default_response_class=ORJSONResponse)
+
+# Module-level adapters dump list responses straight to JSON bytes,
+# bypassing the per-item serialize_response loop
+_FRIENDSHIP_LIST_ADAPTER = TypeAdapter(list[FriendshipResponse])
+_FRIEND_LIST_ADAPTER = TypeAdapter(list[FriendResponse])
+_SHARED_SET_LIST_ADAPTER = TypeAdapter(list[SharedCardSetResponse])
 
 
 # ── Friend Requests ─────────────────────────────────────────────────────────
@@ -29,9 +35,9 @@ router = APIRouter(prefix="/social", tags=["social"])
 )
 async def send_friend_request(
     body: SendFriendRequestRequest,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ) -> FriendshipResponse:
+    current_user, db = auth
     return await social_service.send_friend_request(
         db, current_user.id, body.friend_id
     )
@@ -42,10 +48,14 @@ async def send_friend_request(
     response_model=list[FriendshipResponse],
 )
 async def get_incoming_requests(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> list[FriendshipResponse]:
-    return await social_service.get_pending_requests(db, current_user.id)
+    auth: AuthContext = Depends(get_auth_context),
+) -> Response:
+    current_user, db = auth
+    items = await social_service.get_pending_requests(db, current_user.id)
+    return Response(
+        content=_FRIENDSHIP_LIST_ADAPTER.dump_json(items),
+        media_type="application/json",
+    )
 
 
 @router.post(
@@ -54,9 +64,9 @@ async def get_incoming_requests(
 )
 async def accept_friend_request(
     friendship_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ) -> FriendshipResponse:
+    current_user, db = auth
     return await social_service.accept_friend_request(
         db, friendship_id, current_user.id
     )
@@ -68,9 +78,9 @@ async def accept_friend_request(
 )
 async def reject_friend_request(
     friendship_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ) -> None:
+    current_user, db = auth
     await social_service.reject_friend_request(db, friendship_id, current_user.id)
 
 
@@ -82,10 +92,14 @@ async def reject_friend_request(
     response_model=list[FriendResponse],
 )
 async def get_friends(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> list[FriendResponse]:
-    return await social_service.get_friends(db, current_user.id)
+    auth: AuthContext = Depends(get_auth_context),
+) -> Response:
+    current_user, db = auth
+    items = await social_service.get_friends(db, current_user.id)
+    return Response(
+        content=_FRIEND_LIST_ADAPTER.dump_json(items),
+        media_type="application/json",
+    )
 
 
 @router.delete(
@@ -94,9 +108,9 @@ async def get_friends(
 )
 async def remove_friend(
     friendship_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ) -> None:
+    current_user, db = auth
     await social_service.remove_friend(db, friendship_id, current_user.id)
 
 
@@ -106,9 +120,9 @@ async def remove_friend(
 )
 async def get_friend_progress(
     user_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ) -> FriendProgressResponse:
+    current_user, db = auth
     return await social_service.get_friend_progress(db, current_user.id, user_id)
 
 
@@ -121,9 +135,9 @@ async def get_friend_progress(
 )
 async def search_users(
     q: str = Query(..., min_length=2, max_length=100),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ) -> list[UserSearchResult]:
+    current_user, db = auth
     return await social_service.search_users(db, q, current_user.id)
 
 
@@ -138,9 +152,9 @@ async def search_users(
 async def share_card_set(
     set_id: uuid.UUID,
     body: ShareCardSetRequest,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ) -> SharedCardSetResponse:
+    current_user, db = auth
     return await social_service.share_card_set(
         db, set_id, current_user.id, body.friend_id
     )
@@ -152,9 +166,9 @@ async def share_card_set(
 )
 async def unshare_card_set(
     share_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ) -> None:
+    current_user, db = auth
     await social_service.unshare_card_set(db, share_id, current_user.id)
 
 
@@ -163,10 +177,14 @@ async def unshare_card_set(
     response_model=list[SharedCardSetResponse],
 )
 async def get_shared_with_me(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> list[SharedCardSetResponse]:
-    return await social_service.get_shared_with_me(db, current_user.id)
+    auth: AuthContext = Depends(get_auth_context),
+) -> Response:
+    current_user, db = auth
+    items = await social_service.get_shared_with_me(db, current_user.id)
+    return Response(
+        content=_SHARED_SET_LIST_ADAPTER.dump_json(items),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -174,7 +192,11 @@ async def get_shared_with_me(
     response_model=list[SharedCardSetResponse],
 )
 async def get_my_shared(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> list[SharedCardSetResponse]:
-    return await social_service.get_my_shared(db, current_user.id)
+    auth: AuthContext = Depends(get_auth_context),
+) -> Response:
+    current_user, db = auth
+    items = await social_service.get_my_shared(db, current_user.id)
+    return Response(
+        content=_SHARED_SET_LIST_ADAPTER.dump_json(items),
+        media_type="application/json",
+    )
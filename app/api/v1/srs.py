@@ -1,11 +1,10 @@
 import uuid
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import ORJSONResponse
 
-from app.api.deps import get_current_user
-from app.database import get_db
-from app.models.user import User
+from app.api.deps import AuthContext, get_auth_context
+from app.schemas import _fast
 from app.schemas.srs import (
     ReviewRequest,
     ReviewResponse,
@@ -18,8 +17,7 @@ from app.services.srs_service import (
     submit_review,
 )
 
-router = APIRouter(prefix="/study", tags=["study"])
-
+router = APIRouter(prefix="/study", tags=["study"], default_response_class=ORJSONResponse)
 
 @router.get("/sets/{set_id}/due-cards", response_model=list[StudyCardResponse])
 async def get_due_cards_endpoint(
@@ -27,25 +25,31 @@ async def get_due_cards_endpoint(
     limit: int = Query(20, ge=1, le=100),
     new_first: bool = Query(True),
     practice: bool = Query(False),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    return await get_due_cards(db, current_user, set_id, limit=limit, new_first=new_first, practice=practice)
+    current_user, db = auth
+    items = await get_due_cards(db, current_user, set_id, limit=limit, new_first=new_first, practice=practice)
+    # msgspec structs encode in one C call with no validation pass; the
+    # pydantic StudyCardResponse stays above only for OpenAPI
+    return Response(
+        content=_fast.ENCODER.encode(items),
+        media_type="application/json",
+    )
 
 
 @router.post("/review", response_model=ReviewResponse)
 async def submit_review_endpoint(
     data: ReviewRequest,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     return await submit_review(db, current_user, data.card_id, data.rating)
 
 
 @router.get("/sets/{set_id}/progress", response_model=StudySetProgressResponse)
 async def get_study_progress_endpoint(
     set_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     return await get_set_study_progress(db, current_user, set_id)
@@ -1,12 +1,11 @@
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import ORJSONResponse
 
-from app.api.deps import get_current_user
-from app.database import get_db
-from app.models.user import User
+from app.api.deps import AuthContext, get_auth_context
 from app.schemas.statistics import (
     ActivityResponse,
     ProgressResponse,
+    StatisticsBundle,
     StatisticsOverview,
     StrengthsResponse,
 )
@@ -17,38 +16,59 @@ from app.services.statistics_service import (
     get_strengths,
 )
 
-router = APIRouter(prefix="/statistics", tags=["statistics"])
+router = APIRouter(prefix="/statistics", tags=["statistics"], default_response_class=ORJSONResponse)
+
+
+@router.get("/bundle", response_model=StatisticsBundle)
+async def statistics_bundle(
+    days: int = Query(90, ge=1, le=365),
+    weeks: int = Query(12, ge=1, le=52),
+    auth: AuthContext = Depends(get_auth_context),
+):
+    """All dashboard statistics in one request.
+
+    Dashboards used to issue the four GETs below in parallel, paying auth,
+    dependency resolution and a pooled connection four times over. The
+    queries run sequentially here because they share one AsyncSession.
+    """
+    current_user, db = auth
+    return StatisticsBundle(
+        overview=await get_overview(db, current_user.id, current_user.language_level),
+        activity=await get_activity(db, current_user.id, days),
+        progress=await get_progress(db, current_user.id, weeks),
+        strengths=await get_strengths(db, current_user.id),
+    )
 
 
 @router.get("/overview", response_model=StatisticsOverview)
 async def statistics_overview(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     return await get_overview(db, current_user.id, current_user.language_level)
 
 
 @router.get("/activity", response_model=ActivityResponse)
 async def statistics_activity(
     days: int = Query(90, ge=1, le=365),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     return await get_activity(db, current_user.id, days)
 
 
 @router.get("/progress", response_model=ProgressResponse)
 async def statistics_progress(
     weeks: int = Query(12, ge=1, le=52),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     return await get_progress(db, current_user.id, weeks)
 
 
 @router.get("/strengths", response_model=StrengthsResponse)
 async def statistics_strengths(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
 ):
+    current_user, db = auth
     return await get_strengths(db, current_user.id)
@@ -1,8 +1,13 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 
-from app.api.deps import get_current_user
-from app.database import get_db
+from app.api.deps import (
+    AuthContext,
+    get_auth_context,
+    get_current_user,
+    get_redis,
+    invalidate_cached_user,
+)
 from app.models.user import User
 from app.schemas.user import UserResponse, UserUpdateRequest
 from app.services.auth_service import update_user
@@ -18,7 +23,10 @@ async def get_me(current_user: User = Depends(get_current_user)):
 @router.patch("/me", response_model=UserResponse)
 async def update_me(
     data: UserUpdateRequest,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
+    redis: Redis = Depends(get_redis),
 ):
-    return await update_user(db, current_user, data)
+    current_user, db = auth
+    updated = await update_user(db, current_user, data)
+    await invalidate_cached_user(current_user.id, redis)
+    return updated
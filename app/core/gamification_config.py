@@ -1,3 +1,5 @@
+from bisect import bisect_right
+
 from app.models.gamification import League
 
 # XP rewards per action
@@ -36,3 +38,23 @@ LEAGUE_THRESHOLDS: list[tuple[int, League]] = [
     (1000, League.Silver),
     (0, League.Bronze),
 ]
+
+# Ascending copies folded once at import so the lookups below are a
+# single binary search instead of a linear scan per XP update
+_LEAGUE_BOUNDS = sorted(threshold for threshold, _ in LEAGUE_THRESHOLDS)
+_LEAGUES_ASC = [league for _, league in sorted(LEAGUE_THRESHOLDS)]
+
+
+def level_for_xp(total_xp: int) -> int:
+    """Map total XP to a level: binary search over the threshold table,
+    then arithmetic for the open-ended levels past 10."""
+    if total_xp >= LEVEL_THRESHOLDS[-1]:
+        return len(LEVEL_THRESHOLDS) + (
+            (total_xp - LEVEL_THRESHOLDS[-1]) // LEVEL_INCREMENT_AFTER_10
+        )
+    return max(bisect_right(LEVEL_THRESHOLDS, total_xp), 1)
+
+
+def league_for_xp(total_xp: int) -> League:
+    """Map total XP to a league via binary search."""
+    return _LEAGUES_ASC[max(bisect_right(_LEAGUE_BOUNDS, total_xp) - 1, 0)]
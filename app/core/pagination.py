@@ -0,0 +1,56 @@
+import base64
+import binascii
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+# Opaque keyset-pagination cursors. A cursor encodes the sort-key values of
+# the last row on the previous page, so the next page is an index seek
+# (WHERE (key...) < (...) LIMIT n) instead of an O(offset) scan-and-discard.
+
+
+def encode_cursor(*parts: object) -> str:
+    raw = "|".join(str(part) for part in parts)
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_parts(cursor: str, count: int) -> list[str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+    values = raw.split("|")
+    if len(values) != count:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+    return values
+
+
+def decode_created_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor over (created_at, id) sort keys."""
+    ts, raw_id = _decode_parts(cursor, 2)
+    try:
+        return datetime.fromisoformat(ts), uuid.UUID(raw_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+def decode_order_cursor(cursor: str) -> tuple[int, datetime, uuid.UUID]:
+    """Decode a cursor over (order_index, created_at, id) sort keys."""
+    raw_order, ts, raw_id = _decode_parts(cursor, 3)
+    try:
+        return int(raw_order), datetime.fromisoformat(ts), uuid.UUID(raw_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
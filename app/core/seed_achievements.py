@@ -1,13 +1,14 @@
 import logging
 
-from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.gamification import Achievement, AchievementCondition
 
 logger = logging.getLogger(__name__)
 
-ACHIEVEMENTS = [
+# Tuple: the seed catalog is constant and must never be mutated at runtime
+ACHIEVEMENTS: tuple[dict, ...] = (
     # cards_learned
     {"condition_type": AchievementCondition.cards_learned, "condition_value": 10, "title": "First Steps", "description": "Learn your first 10 cards", "xp_reward": 50},
     {"condition_type": AchievementCondition.cards_learned, "condition_value": 50, "title": "Getting Serious", "description": "Learn 50 cards", "xp_reward": 100},
@@ -44,29 +45,23 @@ ACHIEVEMENTS = [
     {"condition_type": AchievementCondition.friends_count, "condition_value": 1, "title": "First Friend", "description": "Add your first friend", "xp_reward": 25},
     {"condition_type": AchievementCondition.friends_count, "condition_value": 5, "title": "Social Network", "description": "Add 5 friends", "xp_reward": 75},
     {"condition_type": AchievementCondition.friends_count, "condition_value": 10, "title": "Popular", "description": "Add 10 friends", "xp_reward": 150},
-]
+)
 
 
 async def seed_achievements(db: AsyncSession) -> None:
-    """Insert predefined achievements if they don't exist (idempotent)."""
-    result = await db.execute(select(Achievement))
-    existing = result.scalars().all()
+    """Insert predefined achievements if they don't exist (idempotent).
 
-    # Index by (condition_type, condition_value) for dedup
-    existing_keys = {
-        (a.condition_type, a.condition_value) for a in existing
-    }
-
-    added = 0
-    for data in ACHIEVEMENTS:
-        key = (data["condition_type"], data["condition_value"])
-        if key not in existing_keys:
-            achievement = Achievement(**data)
-            db.add(achievement)
-            added += 1
-
-    if added > 0:
-        await db.commit()
-        logger.info("Seeded %d new achievements", added)
-    else:
-        logger.info("All achievements already seeded")
+    One multi-row INSERT; the unique index on (condition_type,
+    condition_value) dedups server-side, so startup never reads the
+    table or materializes ORM rows.
+    """
+    stmt = (
+        insert(Achievement)
+        .values(list(ACHIEVEMENTS))
+        .on_conflict_do_nothing(
+            index_elements=[Achievement.condition_type, Achievement.condition_value],
+        )
+    )
+    result = await db.execute(stmt)
+    await db.commit()
+    logger.info("Achievement seed upserted (%d new rows)", result.rowcount)
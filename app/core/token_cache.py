@@ -0,0 +1,70 @@
+import hashlib
+import threading
+import time
+import uuid
+
+from cachetools import TLRUCache
+
+from app.config import settings
+from app.core.security import decode_token_exp
+
+# Verified-token cache: repeated requests with the same bearer token skip
+# the HMAC check and JSON parse entirely. Each entry lives until the
+# token's own exp (capped at the access-token lifetime), so an expired
+# token is never served from cache; failed verifications are never
+# cached.
+_MAX_TTL = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+
+def _entry_ttu(_key: bytes, value: tuple[uuid.UUID, float], now: float) -> float:
+    _, exp = value
+    return min(exp, now + _MAX_TTL)
+
+
+_decoded_tokens: TLRUCache = TLRUCache(maxsize=10_000, ttu=_entry_ttu, timer=time.time)
+_lock = threading.Lock()
+
+
+def token_digest(token: str) -> str:
+    """Stable short digest of a raw token, for Redis revocation keys."""
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+async def revoke_token(redis, token: str) -> None:
+    """Mark a token revoked cluster-wide until its natural expiry.
+
+    Evicts this process's verified-token entry immediately; other
+    workers pick the revocation up through is_token_revoked on their
+    next user-cache miss for this token.
+    """
+    try:
+        _, exp = decode_token_exp(token, expected_type="access")
+        ttl = max(int(exp - time.time()), 1)
+    except Exception:
+        ttl = _MAX_TTL
+    await redis.set(f"jwt:revoked:{token_digest(token)}", "1", ex=ttl)
+    key = hashlib.blake2b(f"access:{token}".encode(), digest_size=16).digest()
+    with _lock:
+        _decoded_tokens.pop(key, None)
+
+
+async def is_token_revoked(redis, token: str) -> bool:
+    return bool(await redis.exists(f"jwt:revoked:{token_digest(token)}"))
+
+
+def decode_token_cached(token: str, expected_type: str) -> uuid.UUID:
+    """Like decode_token, but memoizes successful verifications for the
+    remaining lifetime of the token. Raises InvalidTokenError on any validation
+    failure, same as the uncached variant."""
+    key = hashlib.blake2b(
+        f"{expected_type}:{token}".encode(), digest_size=16,
+    ).digest()
+    with _lock:
+        cached = _decoded_tokens.get(key)
+    if cached is not None:
+        return cached[0]
+
+    user_id, exp = decode_token_exp(token, expected_type)
+    with _lock:
+        _decoded_tokens[key] = (user_id, exp)
+    return user_id
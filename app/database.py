@@ -9,6 +9,17 @@ engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
+    # No pre-ping: connections are short-lived enough that the extra
+    # SELECT 1 per checkout costs more than the occasional stale retry.
+    pool_pre_ping=False,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    # Fail fast when the pool is exhausted instead of queueing for 30s,
+    # and recycle connections before idle timeouts can kill them
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # Let asyncpg reuse parsed plans for the recurring per-request queries
+    connect_args={"prepared_statement_cache_size": 500},
 )
 
 async_session_factory = async_sessionmaker(
@@ -1,23 +1,46 @@
+import uuid
 from contextlib import asynccontextmanager
 
 import redis.asyncio as aioredis
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
 
 from app.api.v1 import api_v1_router
 from app.config import settings
+from app.core.security import create_access_token, decode_token, hash_password
 from app.core.seed_achievements import seed_achievements
 from app.database import async_session_factory
 
+# Arbitrary but stable key for the seed advisory lock
+_SEED_LOCK_KEY = 0x5EED_ACE
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     app.state.redis = aioredis.from_url(
         settings.REDIS_URL, decode_responses=True,
     )
-    # Seed achievements on startup
+    # Warm the one-time lazy setup in the crypto paths (argon2 context,
+    # JWT algorithm registry) so it isn't paid by the first real request
+    await hash_password("warmup")
+    decode_token(create_access_token(uuid.uuid4()), expected_type="access")
+    # Seed achievements on startup. With multiple workers every process
+    # runs this lifespan; the advisory lock lets exactly one do the work
+    # while the rest skip instead of racing the same INSERT.
     async with async_session_factory() as session:
-        await seed_achievements(session)
+        got_lock = (
+            await session.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": _SEED_LOCK_KEY},
+            )
+        ).scalar()
+        if got_lock:
+            try:
+                await seed_achievements(session)
+            finally:
+                await session.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": _SEED_LOCK_KEY},
+                )
     yield
     await app.state.redis.close()
 
@@ -36,7 +59,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["X-Access-Token"],
+    expose_headers=["X-Access-Token", "X-Next-Cursor"],
 )
 
 app.include_router(api_v1_router)
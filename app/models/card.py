@@ -12,6 +12,7 @@ from sqlalchemy import (
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -43,7 +44,13 @@ class CardSet(Base):
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     category: Mapped[str | None] = mapped_column(String(100), nullable=True)
     difficulty_level: Mapped[LanguageLevel] = mapped_column(
-        Enum(LanguageLevel, name="language_level_enum", create_type=False),
+        Enum(
+            LanguageLevel,
+            name="ck_card_sets_difficulty_level",
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+        ),
         nullable=False,
         default=LanguageLevel.A1,
     )
@@ -65,6 +72,25 @@ class CardSet(Base):
         "Card", back_populates="card_set", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Keyset pagination seeks; an ascending index scanned backwards
+        # serves ORDER BY created_at DESC, id DESC
+        Index("ix_card_sets_user_created", "user_id", "created_at", "id"),
+        Index(
+            "ix_card_sets_public_created",
+            "created_at",
+            "id",
+            postgresql_where=text("is_public"),
+        ),
+        # Trigram GIN index for the admin title ILIKE search
+        Index(
+            "ix_card_sets_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
+
 
 class Card(Base):
     __tablename__ = "cards"
@@ -83,7 +109,13 @@ class Card(Base):
     image_url: Mapped[str | None] = mapped_column(String(512), nullable=True)
     audio_url: Mapped[str | None] = mapped_column(String(512), nullable=True)
     card_type: Mapped[CardType] = mapped_column(
-        Enum(CardType, name="card_type_enum"),
+        Enum(
+            CardType,
+            name="ck_cards_card_type",
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+        ),
         nullable=False,
         default=CardType.flashcard,
     )
@@ -99,5 +131,6 @@ class Card(Base):
     )
 
     __table_args__ = (
-        Index("ix_cards_card_set_id", "card_set_id"),
+        # Also serves the keyset seek over (order_index, created_at, id)
+        Index("ix_cards_set_order", "card_set_id", "order_index", "created_at", "id"),
     )
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -24,8 +24,9 @@ class AIConversation(Base):
     ended_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
-    messages: Mapped[dict | None] = mapped_column(JSON, nullable=True, default=list)
-    feedback: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # JSONB: parsed once on write, read back in binary form
+    messages: Mapped[dict | None] = mapped_column(JSONB, nullable=True, default=list)
+    feedback: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     total_turns: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
     # Relationships
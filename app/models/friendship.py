@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, UniqueConstraint, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -27,7 +27,13 @@ class Friendship(Base):
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     status: Mapped[FriendshipStatus] = mapped_column(
-        Enum(FriendshipStatus, name="friendship_status_enum"),
+        Enum(
+            FriendshipStatus,
+            name="ck_friendships_status",
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+        ),
         nullable=False,
         default=FriendshipStatus.pending,
     )
@@ -45,6 +51,22 @@ class Friendship(Base):
 
     __table_args__ = (
         UniqueConstraint("user_id", "friend_id", name="uq_friendship_pair"),
-        Index("ix_friendships_user_id", "user_id"),
-        Index("ix_friendships_friend_id", "friend_id"),
+        # Partial indexes per hot path: accepted friendships for friend
+        # lists and counts, pending ones on the friend_id side for the
+        # incoming-requests view. Outgoing pending lookups filter on
+        # user_id and are covered by uq_friendship_pair.
+        Index(
+            "ix_friendships_user_accepted", "user_id",
+            postgresql_include=["friend_id"],
+            postgresql_where=text("status = 'accepted'"),
+        ),
+        Index(
+            "ix_friendships_friend_accepted", "friend_id",
+            postgresql_include=["user_id"],
+            postgresql_where=text("status = 'accepted'"),
+        ),
+        Index(
+            "ix_friendships_friend_pending", "friend_id",
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
@@ -16,6 +16,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from uuid6 import uuid7
 
 from app.database import Base
 
@@ -64,8 +65,19 @@ class UserGamification(Base):
     current_streak: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     longest_streak: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     last_activity_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    # Denormalized count maintained on unlock, so the profile endpoint
+    # never has to COUNT(*) user_achievements
+    achievements_unlocked: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
     league: Mapped[League] = mapped_column(
-        Enum(League, name="league_enum"),
+        Enum(
+            League,
+            name="ck_user_gamification_league",
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+        ),
         nullable=False,
         default=League.Bronze,
     )
@@ -75,6 +87,9 @@ class UserGamification(Base):
 
     __table_args__ = (
         Index("ix_user_gamification_league_xp", "league", "total_xp"),
+        # Equality count for the platform-stats active_today aggregate:
+        # index-only scan over the day's entries instead of a table scan
+        Index("ix_user_gamification_last_activity", "last_activity_date"),
     )
 
 
@@ -88,12 +103,24 @@ class Achievement(Base):
     description: Mapped[str] = mapped_column(Text, nullable=False)
     icon_url: Mapped[str | None] = mapped_column(String(512), nullable=True)
     condition_type: Mapped[AchievementCondition] = mapped_column(
-        Enum(AchievementCondition, name="achievement_condition_enum"),
+        Enum(
+            AchievementCondition,
+            name="ck_achievements_condition_type",
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+        ),
         nullable=False,
     )
     condition_value: Mapped[int] = mapped_column(Integer, nullable=False)
     xp_reward: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
+    __table_args__ = (
+        UniqueConstraint(
+            "condition_type", "condition_value", name="uq_achievement_condition",
+        ),
+    )
+
 
 class UserAchievement(Base):
     __tablename__ = "user_achievements"
@@ -125,15 +152,26 @@ class UserAchievement(Base):
 class XpEvent(Base):
     __tablename__ = "xp_events"
 
+    # Time-ordered UUIDv7 PKs keep inserts appending to the right edge of
+    # the B-tree — xp_events is the hottest write path in the app
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     xp_amount: Mapped[int] = mapped_column(Integer, nullable=False)
     event_type: Mapped[XpEventType] = mapped_column(
-        Enum(XpEventType, name="xp_event_type_enum"), nullable=False
+        # VARCHAR + CHECK instead of a native enum: adding values no longer
+        # needs an ALTER TYPE migration
+        Enum(
+            XpEventType,
+            name="ck_xp_events_event_type",
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+        ),
+        nullable=False,
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
@@ -143,5 +181,9 @@ class XpEvent(Base):
     user: Mapped["User"] = relationship("User", back_populates="xp_events")
 
     __table_args__ = (
-        Index("ix_xp_events_user_created", "user_id", "created_at"),
+        # Covers SUM(xp_amount) range queries as index-only scans
+        Index(
+            "ix_xp_events_user_created", "user_id", "created_at",
+            postgresql_include=["xp_amount"],
+        ),
     )
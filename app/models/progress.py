@@ -1,8 +1,16 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, UniqueConstraint, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import REAL, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -20,9 +28,11 @@ class UserCardProgress(Base):
     card_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("cards.id", ondelete="CASCADE"), nullable=False
     )
-    ease_factor: Mapped[float] = mapped_column(Float, nullable=False, default=2.5)
-    interval: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
-    repetitions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # float4/int2 are plenty for SM-2 precision and ranges; this table
+    # grows as users x cards, so row width matters
+    ease_factor: Mapped[float] = mapped_column(REAL, nullable=False, default=2.5)
+    interval: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
+    repetitions: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
     next_review_date: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -38,5 +48,10 @@ class UserCardProgress(Base):
 
     __table_args__ = (
         UniqueConstraint("user_id", "card_id", name="uq_user_card_progress"),
-        Index("ix_user_card_progress_user_review", "user_id", "next_review_date"),
+        # INCLUDE carries the SRS payload columns so due-card scans can
+        # resolve the join and scheduling fields without heap fetches
+        Index(
+            "ix_user_card_progress_user_review", "user_id", "next_review_date",
+            postgresql_include=["card_id", "ease_factor", "interval", "repetitions"],
+        ),
     )
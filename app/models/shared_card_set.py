@@ -4,6 +4,7 @@ from datetime import datetime
 from sqlalchemy import DateTime, ForeignKey, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from uuid6 import uuid7
 
 from app.database import Base
 
@@ -11,8 +12,10 @@ from app.database import Base
 class SharedCardSet(Base):
     __tablename__ = "shared_card_sets"
 
+    # Time-ordered UUIDv7 PKs keep inserts appending to the right edge of
+    # the B-tree instead of scattering across pages
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     card_set_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
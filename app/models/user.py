@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, Integer, String, func
+from sqlalchemy import Boolean, DateTime, Enum, Index, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -31,7 +31,13 @@ class User(Base):
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
     avatar_url: Mapped[str | None] = mapped_column(String(512), nullable=True)
     language_level: Mapped[LanguageLevel] = mapped_column(
-        Enum(LanguageLevel, name="language_level_enum"),
+        Enum(
+            LanguageLevel,
+            name="ck_users_language_level",
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+        ),
         nullable=False,
         default=LanguageLevel.A1,
     )
@@ -73,3 +79,22 @@ class User(Base):
     conversations: Mapped[list["AIConversation"]] = relationship(
         "AIConversation", back_populates="user", cascade="all, delete-orphan"
     )
+
+    __table_args__ = (
+        # Keyset pagination seeks for the admin user listing
+        Index("ix_users_created_id", "created_at", "id"),
+        # Trigram GIN indexes serve the admin ILIKE '%...%' search;
+        # requires the pg_trgm extension (created in the migration)
+        Index(
+            "ix_users_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_users_full_name_trgm",
+            "full_name",
+            postgresql_using="gin",
+            postgresql_ops={"full_name": "gin_trgm_ops"},
+        ),
+    )
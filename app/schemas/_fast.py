@@ -0,0 +1,171 @@
+"""msgspec mirrors of the hottest list-response schemas.
+
+These structs carry the exact wire shape of their pydantic namesakes but
+serialize through a single shared C encoder with no validation pass. The
+pydantic originals stay on the endpoints as ``response_model`` so the
+OpenAPI schema is unchanged; only the runtime payload goes through here.
+"""
+
+import uuid
+from datetime import datetime
+
+import msgspec
+
+from app.models.card import CardType
+from app.models.gamification import League
+from app.models.user import LanguageLevel
+
+ENCODER = msgspec.json.Encoder()
+
+
+class AdminUserResponse(msgspec.Struct):
+    id: uuid.UUID
+    email: str
+    full_name: str
+    language_level: LanguageLevel
+    is_premium: bool
+    is_active: bool
+    is_admin: bool
+    created_at: datetime
+    card_sets_count: int
+    total_xp: int
+    level: int
+    league: str
+
+
+class PaginatedAdminUserResponse(msgspec.Struct):
+    items: list[AdminUserResponse]
+    limit: int
+    has_more: bool
+    next_cursor: str | None = None
+
+
+class AdminCardSetResponse(msgspec.Struct):
+    id: uuid.UUID
+    title: str
+    user_email: str
+    user_full_name: str
+    difficulty_level: LanguageLevel
+    card_count: int
+    is_public: bool
+    is_ai_generated: bool
+    created_at: datetime
+
+
+class PaginatedAdminCardSetResponse(msgspec.Struct):
+    items: list[AdminCardSetResponse]
+    limit: int
+    has_more: bool
+    next_cursor: str | None = None
+
+
+class CardResponse(msgspec.Struct):
+    id: uuid.UUID
+    card_set_id: uuid.UUID
+    front_text: str
+    back_text: str
+    example_sentence: str | None
+    image_url: str | None
+    audio_url: str | None
+    card_type: CardType
+    order_index: int
+    created_at: datetime
+
+
+class PaginatedCardResponse(msgspec.Struct):
+    items: list[CardResponse]
+    limit: int
+    has_more: bool
+    next_cursor: str | None = None
+
+
+class DashboardGamification(msgspec.Struct):
+    total_xp: int
+    level: int
+    current_streak: int
+    longest_streak: int
+    league: League
+
+
+class DashboardCardSetItem(msgspec.Struct):
+    id: uuid.UUID
+    title: str
+    category: str | None
+    difficulty_level: LanguageLevel
+    card_count: int
+    learned_cards: int
+    due_cards: int
+    updated_at: datetime | None
+
+
+class DashboardResponse(msgspec.Struct):
+    gamification: DashboardGamification
+    today_xp: int
+    daily_xp_goal: int
+    today_reviews: int
+    recent_sets: list[DashboardCardSetItem]
+    total_cards_learned: int
+    total_due_cards: int
+
+
+class PlatformStatsResponse(msgspec.Struct):
+    total_users: int
+    premium_users: int
+    total_card_sets: int
+    public_card_sets: int
+    total_cards: int
+    total_conversations: int
+    active_today: int
+
+
+class LeaderboardEntry(msgspec.Struct):
+    rank: int
+    user_id: uuid.UUID
+    full_name: str
+    avatar_url: str | None
+    total_xp: int
+    level: int
+    league: League
+
+
+class LeaderboardResponse(msgspec.Struct):
+    entries: list[LeaderboardEntry]
+    period: str
+    user_rank: int | None = None
+
+
+class ConversationSummary(msgspec.Struct):
+    id: uuid.UUID
+    scenario: str
+    scenario_title: str
+    started_at: datetime
+    ended_at: datetime | None
+    total_turns: int
+    is_active: bool
+
+
+class CardProgressResponse(msgspec.Struct):
+    id: uuid.UUID
+    user_id: uuid.UUID
+    card_id: uuid.UUID
+    ease_factor: float
+    interval: int
+    repetitions: int
+    next_review_date: datetime
+    last_reviewed_at: datetime | None
+    total_reviews: int
+    correct_reviews: int
+
+
+class StudyCardResponse(msgspec.Struct):
+    id: uuid.UUID
+    card_set_id: uuid.UUID
+    front_text: str
+    back_text: str
+    example_sentence: str | None
+    image_url: str | None
+    audio_url: str | None
+    card_type: CardType
+    order_index: int
+    created_at: datetime
+    progress: CardProgressResponse | None = None
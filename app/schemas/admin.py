@@ -23,9 +23,9 @@ class AdminUserResponse(BaseModel):
 
 class PaginatedAdminUserResponse(BaseModel):
     items: list[AdminUserResponse]
-    total: int
-    skip: int
     limit: int
+    has_more: bool
+    next_cursor: str | None = None
 
 
 class AdminUserUpdateRequest(BaseModel):
@@ -47,9 +47,9 @@ class AdminCardSetResponse(BaseModel):
 
 class PaginatedAdminCardSetResponse(BaseModel):
     items: list[AdminCardSetResponse]
-    total: int
-    skip: int
     limit: int
+    has_more: bool
+    next_cursor: str | None = None
 
 
 class PlatformStatsResponse(BaseModel):
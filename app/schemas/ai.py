@@ -1,3 +1,4 @@
+import msgspec
 from pydantic import BaseModel, Field
 
 from app.models.user import LanguageLevel
@@ -11,7 +12,9 @@ class GenerateCardsRequest(BaseModel):
     interests: list[str] = Field(default_factory=list, max_length=10)
 
 
-class GeneratedCardItem(BaseModel):
+class GeneratedCardItem(msgspec.Struct):
+    # Internal DTO (never a response model) — msgspec validates whole
+    # LLM batches in one C call and keeps per-card memory low.
     front_text: str
     back_text: str
     example_sentence: str | None = None
@@ -86,16 +86,17 @@ class CardUpdate(BaseModel):
 
 class PaginatedCardSetResponse(BaseModel):
     items: list[CardSetResponse]
-    total: int
-    skip: int
     limit: int
+    has_more: bool
+    # Opaque keyset cursor; pass back as ?after= to fetch the next page
+    next_cursor: str | None = None
 
 
 class PaginatedCardResponse(BaseModel):
     items: list[CardResponse]
-    total: int
-    skip: int
     limit: int
+    has_more: bool
+    next_cursor: str | None = None
 
 
 # --- Bulk / Import ---
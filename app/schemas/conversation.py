@@ -54,7 +54,14 @@ class ConversationFeedback(BaseModel):
 
 class ConversationEndResponse(BaseModel):
     conversation_id: uuid.UUID
-    feedback: ConversationFeedback
+    feedback_status: str
+    feedback: ConversationFeedback | None = None
+
+
+class ConversationFeedbackStatusResponse(BaseModel):
+    conversation_id: uuid.UUID
+    status: str
+    feedback: ConversationFeedback | None = None
 
 
 class ConversationSummary(BaseModel):
@@ -8,18 +8,20 @@ from app.models.card import CardType
 
 
 class ReviewRating(str, enum.Enum):
-    again = "again"   # quality = 0
-    hard = "hard"     # quality = 3
-    good = "good"     # quality = 4
-    easy = "easy"     # quality = 5
-
-
-RATING_TO_QUALITY: dict[ReviewRating, int] = {
-    ReviewRating.again: 0,
-    ReviewRating.hard: 3,
-    ReviewRating.good: 4,
-    ReviewRating.easy: 5,
-}
+    # Each member carries its SM-2 quality score directly, so the review
+    # hot path reads rating.quality instead of going through a dict
+    quality: int
+
+    def __new__(cls, value: str, quality: int) -> "ReviewRating":
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        obj.quality = quality
+        return obj
+
+    again = "again", 0
+    hard = "hard", 3
+    good = "good", 4
+    easy = "easy", 5
 
 
 class ReviewRequest(BaseModel):
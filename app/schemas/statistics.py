@@ -59,3 +59,10 @@ class SetStrength(BaseModel):
 
 class StrengthsResponse(BaseModel):
     sets: list[SetStrength]
+
+
+class StatisticsBundle(BaseModel):
+    overview: StatisticsOverview
+    activity: ActivityResponse
+    progress: ProgressResponse
+    strengths: StrengthsResponse
@@ -2,82 +2,113 @@ import uuid
 from datetime import date
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, or_, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
+from app.core.pagination import decode_created_cursor, encode_cursor
 from app.models.card import Card, CardSet
 from app.models.conversation import AIConversation
-from app.models.gamification import UserGamification
+from app.models.gamification import League, UserGamification
 from app.models.user import User
-from app.schemas.admin import (
-    AdminCardSetResponse,
-    AdminUserResponse,
-    AdminUserUpdateRequest,
-    PaginatedAdminCardSetResponse,
-    PaginatedAdminUserResponse,
-    PlatformStatsResponse,
-)
+from app.schemas import _fast
+from app.schemas.admin import AdminUserUpdateRequest
+
+
+def _admin_user_response(
+    user: User, gam: UserGamification | None, card_sets_count: int,
+) -> _fast.AdminUserResponse:
+    return _fast.AdminUserResponse(
+        id=user.id,
+        email=user.email,
+        full_name=user.full_name,
+        language_level=user.language_level,
+        is_premium=user.is_premium,
+        is_active=user.is_active,
+        is_admin=user.is_admin,
+        created_at=user.created_at,
+        card_sets_count=card_sets_count,
+        total_xp=gam.total_xp if gam else 0,
+        level=gam.level if gam else 1,
+        league=gam.league.value if gam else "Bronze",
+    )
 
 
 async def list_users(
     db: AsyncSession,
-    skip: int = 0,
+    after: str | None = None,
     limit: int = 20,
     search: str | None = None,
-) -> PaginatedAdminUserResponse:
-    base_query = select(User)
-    count_query = select(func.count()).select_from(User)
+) -> _fast.PaginatedAdminUserResponse:
+    # Normalize once; a sub-2-char needle would sweep most of the trigram
+    # index, so answer it without touching the DB
+    search = search.strip() if search else None
+    if search is not None and len(search) < 2:
+        return _fast.PaginatedAdminUserResponse(
+            items=[], limit=limit, has_more=False, next_cursor=None
+        )
+
+    # One round-trip per page: gamification rides as an outer join, the
+    # card-set count as a correlated scalar subquery, and every column is
+    # labelled to match the response struct so rows drop straight into it.
+    # No password_hash on the wire and no ORM instance build per row.
+    base_query = select(
+        User.id,
+        User.email,
+        User.full_name,
+        User.language_level,
+        User.is_premium,
+        User.is_active,
+        User.is_admin,
+        User.created_at,
+        select(func.count())
+        .select_from(CardSet)
+        .where(CardSet.user_id == User.id)
+        .correlate(User)
+        .scalar_subquery()
+        .label("card_sets_count"),
+        func.coalesce(UserGamification.total_xp, 0).label("total_xp"),
+        func.coalesce(UserGamification.level, 1).label("level"),
+        func.coalesce(UserGamification.league, League.Bronze).label("league"),
+    ).outerjoin(UserGamification, UserGamification.user_id == User.id)
 
     if search:
         pattern = f"%{search}%"
-        filter_clause = or_(
-            User.email.ilike(pattern),
-            User.full_name.ilike(pattern),
-        )
-        base_query = base_query.where(filter_clause)
-        count_query = count_query.where(filter_clause)
+        if "@" in search:
+            # Only email addresses contain '@'; skip the name lookup
+            base_query = base_query.where(User.email.ilike(pattern))
+        else:
+            base_query = base_query.where(
+                or_(
+                    User.email.ilike(pattern),
+                    User.full_name.ilike(pattern),
+                )
+            )
 
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    if after:
+        # Keyset seek: resume strictly after the last row of the previous page
+        base_query = base_query.where(
+            tuple_(User.created_at, User.id) < decode_created_cursor(after)
+        )
 
+    # Fetch one extra row instead of a separate COUNT(*) round-trip
     result = await db.execute(
-        base_query.order_by(User.created_at.desc()).offset(skip).limit(limit)
+        base_query.order_by(User.created_at.desc(), User.id.desc()).limit(limit + 1)
     )
-    users = result.scalars().all()
+    rows = result.mappings().all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
 
-    items = []
-    for u in users:
-        # Count card sets
-        sets_result = await db.execute(
-            select(func.count()).select_from(CardSet).where(CardSet.user_id == u.id)
-        )
-        card_sets_count = sets_result.scalar_one()
+    # Row mappings are keyed exactly like the struct fields
+    items = [_fast.AdminUserResponse(**m) for m in rows]
 
-        # Get gamification
-        gam_result = await db.execute(
-            select(UserGamification).where(UserGamification.user_id == u.id)
-        )
-        gam = gam_result.scalar_one_or_none()
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor(last["created_at"].isoformat(), last["id"])
 
-        items.append(
-            AdminUserResponse(
-                id=u.id,
-                email=u.email,
-                full_name=u.full_name,
-                language_level=u.language_level,
-                is_premium=u.is_premium,
-                is_active=u.is_active,
-                is_admin=u.is_admin,
-                created_at=u.created_at,
-                card_sets_count=card_sets_count,
-                total_xp=gam.total_xp if gam else 0,
-                level=gam.level if gam else 1,
-                league=gam.league.value if gam else "Bronze",
-            )
-        )
-
-    return PaginatedAdminUserResponse(
-        items=items, total=total, skip=skip, limit=limit
+    return _fast.PaginatedAdminUserResponse(
+        items=items, limit=limit, has_more=has_more, next_cursor=next_cursor
     )
 
 
@@ -85,44 +116,41 @@ async def update_user_admin(
     db: AsyncSession,
     user_id: uuid.UUID,
     data: AdminUserUpdateRequest,
-) -> AdminUserResponse:
-    user = await db.get(User, user_id)
+) -> _fast.AdminUserResponse:
+    changes = data.model_dump(exclude_none=True)
+    if changes:
+        # Single UPDATE ... RETURNING instead of a SELECT, attribute
+        # mutation and flush
+        result = await db.execute(
+            update(User).where(User.id == user_id).values(**changes).returning(User)
+        )
+        user = result.scalar_one_or_none()
+    else:
+        user = await db.get(User, user_id)
+
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    if data.is_premium is not None:
-        user.is_premium = data.is_premium
-    if data.is_active is not None:
-        user.is_active = data.is_active
-
-    await db.flush()
-
-    sets_result = await db.execute(
-        select(func.count()).select_from(CardSet).where(CardSet.user_id == user.id)
-    )
-    card_sets_count = sets_result.scalar_one()
+    # Gamification and card-set count in one round-trip
+    row = (
+        await db.execute(
+            select(
+                UserGamification,
+                select(func.count())
+                .select_from(CardSet)
+                .where(CardSet.user_id == user_id)
+                .scalar_subquery()
+                .label("card_sets_count"),
+            )
+            .select_from(User)
+            .outerjoin(UserGamification, UserGamification.user_id == User.id)
+            .where(User.id == user_id)
+        )
+    ).one()
 
-    gam_result = await db.execute(
-        select(UserGamification).where(UserGamification.user_id == user.id)
-    )
-    gam = gam_result.scalar_one_or_none()
-
-    return AdminUserResponse(
-        id=user.id,
-        email=user.email,
-        full_name=user.full_name,
-        language_level=user.language_level,
-        is_premium=user.is_premium,
-        is_active=user.is_active,
-        is_admin=user.is_admin,
-        created_at=user.created_at,
-        card_sets_count=card_sets_count,
-        total_xp=gam.total_xp if gam else 0,
-        level=gam.level if gam else 1,
-        league=gam.league.value if gam else "Bronze",
-    )
+    return _admin_user_response(user, row.UserGamification, row.card_sets_count)
 
 
 async def delete_user(db: AsyncSession, user_id: uuid.UUID) -> None:
@@ -137,33 +165,42 @@ async def delete_user(db: AsyncSession, user_id: uuid.UUID) -> None:
 
 async def list_public_card_sets(
     db: AsyncSession,
-    skip: int = 0,
+    after: str | None = None,
     limit: int = 20,
     search: str | None = None,
-) -> PaginatedAdminCardSetResponse:
-    base_query = select(CardSet).where(CardSet.is_public == True)  # noqa: E712
-    count_query = (
-        select(func.count()).select_from(CardSet).where(CardSet.is_public == True)  # noqa: E712
+) -> _fast.PaginatedAdminCardSetResponse:
+    # Owner rides the page query as an outer join instead of one
+    # db.get(User, ...) per row; raiseload turns any stray lazy-load on
+    # these rows into an immediate error instead of a silent N+1
+    base_query = (
+        select(CardSet, User)
+        .options(raiseload("*"))
+        .outerjoin(User, User.id == CardSet.user_id)
+        .where(CardSet.is_public == True)  # noqa: E712
     )
 
     if search:
         pattern = f"%{search}%"
         base_query = base_query.where(CardSet.title.ilike(pattern))
-        count_query = count_query.where(CardSet.title.ilike(pattern))
 
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    if after:
+        base_query = base_query.where(
+            tuple_(CardSet.created_at, CardSet.id) < decode_created_cursor(after)
+        )
 
     result = await db.execute(
-        base_query.order_by(CardSet.created_at.desc()).offset(skip).limit(limit)
+        base_query.order_by(CardSet.created_at.desc(), CardSet.id.desc()).limit(
+            limit + 1
+        )
     )
-    card_sets = result.scalars().all()
+    rows = result.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
 
     items = []
-    for cs in card_sets:
-        user = await db.get(User, cs.user_id)
+    for cs, user in rows:
         items.append(
-            AdminCardSetResponse(
+            _fast.AdminCardSetResponse(
                 id=cs.id,
                 title=cs.title,
                 user_email=user.email if user else "deleted",
@@ -176,8 +213,13 @@ async def list_public_card_sets(
             )
         )
 
-    return PaginatedAdminCardSetResponse(
-        items=items, total=total, skip=skip, limit=limit
+    next_cursor = None
+    if has_more:
+        last = rows[-1][0]
+        next_cursor = encode_cursor(last.created_at.isoformat(), last.id)
+
+    return _fast.PaginatedAdminCardSetResponse(
+        items=items, limit=limit, has_more=has_more, next_cursor=next_cursor
     )
 
 
@@ -191,50 +233,35 @@ async def delete_card_set_admin(db: AsyncSession, set_id: uuid.UUID) -> None:
     await db.flush()
 
 
-async def get_platform_stats(db: AsyncSession) -> PlatformStatsResponse:
-    total_users = (
-        await db.execute(select(func.count()).select_from(User))
-    ).scalar_one()
-
-    premium_users = (
-        await db.execute(
-            select(func.count()).select_from(User).where(User.is_premium == True)  # noqa: E712
-        )
-    ).scalar_one()
-
-    total_card_sets = (
-        await db.execute(select(func.count()).select_from(CardSet))
-    ).scalar_one()
-
-    public_card_sets = (
-        await db.execute(
-            select(func.count()).select_from(CardSet).where(CardSet.is_public == True)  # noqa: E712
-        )
-    ).scalar_one()
-
-    total_cards = (
-        await db.execute(select(func.count()).select_from(Card))
-    ).scalar_one()
-
-    total_conversations = (
-        await db.execute(select(func.count()).select_from(AIConversation))
-    ).scalar_one()
-
-    today = date.today()
-    active_today = (
-        await db.execute(
-            select(func.count())
-            .select_from(UserGamification)
-            .where(UserGamification.last_activity_date == today)
-        )
-    ).scalar_one()
-
-    return PlatformStatsResponse(
-        total_users=total_users,
-        premium_users=premium_users,
-        total_card_sets=total_card_sets,
-        public_card_sets=public_card_sets,
-        total_cards=total_cards,
-        total_conversations=total_conversations,
-        active_today=active_today,
+async def get_platform_stats(db: AsyncSession) -> _fast.PlatformStatsResponse:
+    # All seven counts as scalar subqueries of one SELECT: a single
+    # round-trip instead of seven awaited back-to-back
+    stmt = select(
+        select(func.count()).select_from(User).scalar_subquery().label("total_users"),
+        select(func.count())
+        .select_from(User)
+        .where(User.is_premium == True)  # noqa: E712
+        .scalar_subquery()
+        .label("premium_users"),
+        select(func.count())
+        .select_from(CardSet)
+        .scalar_subquery()
+        .label("total_card_sets"),
+        select(func.count())
+        .select_from(CardSet)
+        .where(CardSet.is_public == True)  # noqa: E712
+        .scalar_subquery()
+        .label("public_card_sets"),
+        select(func.count()).select_from(Card).scalar_subquery().label("total_cards"),
+        select(func.count())
+        .select_from(AIConversation)
+        .scalar_subquery()
+        .label("total_conversations"),
+        select(func.count())
+        .select_from(UserGamification)
+        .where(UserGamification.last_activity_date == date.today())
+        .scalar_subquery()
+        .label("active_today"),
     )
+    row = (await db.execute(stmt)).one()
+    return _fast.PlatformStatsResponse(**row._mapping)
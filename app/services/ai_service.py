@@ -1,12 +1,13 @@
+import asyncio
 import hashlib
-import json
 import logging
 
+import msgspec
 from fastapi import HTTPException, status
 from redis.asyncio import Redis
-from sqlalchemy import select
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.ai.generator import generate_cards
 from app.config import settings
@@ -36,18 +37,44 @@ NATIVE_LANGUAGE_MAP = {
 def _build_cache_key(
     topic: str, level: str, count: int, interests: list[str], native_language: str,
 ) -> str:
-    raw = json.dumps({
-        "topic": topic.lower().strip(),
-        "level": level,
-        "count": count,
-        "interests": sorted(interests),
-        "native_language": native_language,
-    }, sort_keys=True)
-    digest = hashlib.sha256(raw.encode()).hexdigest()[:16]
-    return f"ai:cache:{digest}"
+    # Stream the components straight into blake2b — no intermediate
+    # serialized dict, and blake2b is cheaper than SHA-256 for a
+    # non-cryptographic cache key. '|' keeps the fields unambiguous.
+    key = hashlib.blake2b(digest_size=16)
+    key.update(topic.lower().strip().encode())
+    key.update(b"|")
+    key.update(level.encode())
+    key.update(b"|")
+    key.update(count.to_bytes(2, "big"))
+    key.update(b"|")
+    key.update(",".join(sorted(interests)).encode())
+    key.update(b"|")
+    key.update(native_language.encode())
+    return f"ai:cache:{key.hexdigest()}"
+
+
+# Atomic increment with TTL set only on the window's first hit; returns
+# the new count so the whole check is one round-trip with no GET/INCR race
+_RATE_LIMIT_LUA = """
+local n = redis.call('INCR', KEYS[1])
+if n == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return n
+"""
+
+_rate_limit_script = None
+
+# How long a generation lock may outlive its holder; also bounds how long
+# concurrent misses poll the cache before generating themselves
+_GENERATION_LOCK_TTL = 30
 
 
 async def _check_rate_limit(redis: Redis, user: User) -> None:
+    global _rate_limit_script
+    if _rate_limit_script is None:
+        _rate_limit_script = redis.register_script(_RATE_LIMIT_LUA)
+
     key = f"ai:ratelimit:{user.id}"
     limit = (
         settings.AI_RATE_LIMIT_PREMIUM_PER_MINUTE
@@ -55,18 +82,13 @@ async def _check_rate_limit(redis: Redis, user: User) -> None:
         else settings.AI_RATE_LIMIT_PER_MINUTE
     )
 
-    current = await redis.get(key)
-    if current is not None and int(current) >= limit:
+    count = await _rate_limit_script(keys=[key], args=[60])
+    if int(count) > limit:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="AI generation rate limit exceeded. Please try again later.",
         )
 
-    pipe = redis.pipeline()
-    pipe.incr(key)
-    pipe.expire(key, 60)
-    await pipe.execute()
-
 
 async def generate_card_set(
     db: AsyncSession,
@@ -86,24 +108,48 @@ async def generate_card_set(
     )
     cached = await redis.get(cache_key)
 
+    items: list[GeneratedCardItem] | None = None
+    got_lock = False
     if cached is not None:
         logger.info("Cache hit for key=%s", cache_key)
-        items = [GeneratedCardItem(**c) for c in json.loads(cached)]
+        items = msgspec.json.decode(cached, type=list[GeneratedCardItem])
     else:
-        # Generate via LLM
-        items = await generate_cards(
-            topic=request.topic,
-            level=level,
-            count=request.count,
-            interests=request.interests,
-            native_language=native_language,
-        )
-        # Store in cache
-        await redis.set(
-            cache_key,
-            json.dumps([item.model_dump() for item in items]),
-            ex=settings.AI_CACHE_TTL_SECONDS,
+        # Single-flight: concurrent misses on the same key would each fire
+        # an expensive LLM call. The first miss takes a short NX lock and
+        # generates; the rest poll the cache until the result lands.
+        lock_key = f"ai:lock:{cache_key}"
+        got_lock = bool(
+            await redis.set(lock_key, "1", nx=True, ex=_GENERATION_LOCK_TTL)
         )
+        if not got_lock:
+            for _ in range(_GENERATION_LOCK_TTL):
+                await asyncio.sleep(1)
+                cached = await redis.get(cache_key)
+                if cached is not None:
+                    logger.info("Cache hit after wait for key=%s", cache_key)
+                    items = msgspec.json.decode(
+                        cached, type=list[GeneratedCardItem]
+                    )
+                    break
+
+    if items is None:
+        # Lock holder, or the lock expired without a cached result
+        try:
+            items = await generate_cards(
+                topic=request.topic,
+                level=level,
+                count=request.count,
+                interests=request.interests,
+                native_language=native_language,
+            )
+            await redis.set(
+                cache_key,
+                msgspec.json.encode(items),
+                ex=settings.AI_CACHE_TTL_SECONDS,
+            )
+        finally:
+            if got_lock:
+                await redis.delete(lock_key)
 
     # Save to DB
     card_set = CardSet(
@@ -117,26 +163,28 @@ async def generate_card_set(
     db.add(card_set)
     await db.flush()
 
-    for idx, item in enumerate(items):
-        card = Card(
-            card_set_id=card_set.id,
-            front_text=item.front_text[:500],
-            back_text=item.back_text[:500],
-            example_sentence=item.example_sentence,
-            card_type=CardType.flashcard,
-            order_index=idx,
+    # Insert all cards in one statement instead of N per-row INSERTs;
+    # RETURNING gives back the rows so no reload SELECT is needed
+    cards: list[Card] = []
+    if items:
+        result = await db.execute(
+            insert(Card).returning(Card, sort_by_parameter_order=True),
+            [
+                {
+                    "card_set_id": card_set.id,
+                    "front_text": item.front_text[:500],
+                    "back_text": item.back_text[:500],
+                    "example_sentence": item.example_sentence,
+                    "card_type": CardType.flashcard,
+                    "order_index": idx,
+                }
+                for idx, item in enumerate(items)
+            ],
         )
-        db.add(card)
-
-    await db.flush()
+        cards = list(result.scalars().all())
 
     # Award XP for AI generation
     await award_xp(db, user, XP_AI_GENERATION, XpEventType.ai_generation)
 
-    # Reload with cards eagerly loaded
-    result = await db.execute(
-        select(CardSet)
-        .options(selectinload(CardSet.cards))
-        .where(CardSet.id == card_set.id)
-    )
-    return result.scalar_one()
+    set_committed_value(card_set, "cards", cards)
+    return card_set
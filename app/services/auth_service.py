@@ -1,14 +1,31 @@
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.core.security import hash_password, verify_password
+from app.core.security import hash_password, verify_and_update_password
 from app.models.user import User
 from app.models.user_interest import UserInterest
 from app.schemas.user import UserRegisterRequest, UserUpdateRequest
 
+# Columns request handling actually reads; password_hash is deliberately
+# excluded and loaded only on credential-verification paths.
+REQUEST_USER_COLUMNS = (
+    User.email,
+    User.full_name,
+    User.avatar_url,
+    User.language_level,
+    User.native_language,
+    User.daily_xp_goal,
+    User.is_premium,
+    User.is_active,
+    User.is_admin,
+    User.created_at,
+    User.updated_at,
+)
+
 
 async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
     result = await db.execute(
@@ -19,19 +36,26 @@ async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
     return result.scalar_one_or_none()
 
 
-async def get_user_by_id(db: AsyncSession, user_id: uuid.UUID) -> User | None:
-    result = await db.execute(
+async def get_user_by_id(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    columns: tuple | None = None,
+) -> User | None:
+    stmt = (
         select(User)
         .options(selectinload(User.interests))
         .where(User.id == user_id)
     )
+    if columns is not None:
+        stmt = stmt.options(load_only(*columns))
+    result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
 
 async def create_user(db: AsyncSession, data: UserRegisterRequest) -> User:
     user = User(
         email=data.email,
-        password_hash=hash_password(data.password),
+        password_hash=await hash_password(data.password),
         full_name=data.full_name,
         native_language=data.native_language,
         language_level=data.language_level,
@@ -39,21 +63,29 @@ async def create_user(db: AsyncSession, data: UserRegisterRequest) -> User:
     db.add(user)
     await db.flush()
 
-    for interest_name in data.interests:
-        interest = UserInterest(user_id=user.id, interest=interest_name)
-        db.add(interest)
+    interests = [
+        UserInterest(user_id=user.id, interest=interest_name)
+        for interest_name in data.interests
+    ]
+    db.add_all(interests)
     await db.flush()
 
-    # Reload with interests
-    return await get_user_by_id(db, user.id)  # type: ignore[return-value]
+    # The flushed rows are the collection; skip the reload SELECT
+    set_committed_value(user, "interests", interests)
+    return user
 
 
 async def authenticate_user(db: AsyncSession, email: str, password: str) -> User | None:
     user = await get_user_by_email(db, email)
     if user is None:
         return None
-    if not verify_password(password, user.password_hash):
+    valid, new_hash = await verify_and_update_password(password, user.password_hash)
+    if not valid:
         return None
+    if new_hash is not None:
+        # Lazy rehash: rotate legacy bcrypt hashes to argon2 on login
+        user.password_hash = new_hash
+        await db.flush()
     return user
 
 
@@ -63,18 +95,28 @@ async def update_user(db: AsyncSession, user: User, data: UserUpdateRequest) ->
         setattr(user, field, value)
 
     if data.interests is not None:
-        # Replace all interests
-        for old_interest in user.interests:
-            await db.delete(old_interest)
-        await db.flush()
-        for interest_name in data.interests:
-            interest = UserInterest(user_id=user.id, interest=interest_name)
-            db.add(interest)
+        # Replace all interests: one DELETE and one multi-row INSERT
+        # instead of a statement per row
+        await db.execute(
+            delete(UserInterest).where(UserInterest.user_id == user.id)
+        )
+        if data.interests:
+            await db.execute(
+                insert(UserInterest),
+                [
+                    {"user_id": user.id, "interest": interest_name}
+                    for interest_name in data.interests
+                ],
+            )
+
+        # The bulk statements bypass the session, so drop the stale
+        # collection before the reload below repopulates it
+        db.expire(user, ["interests"])
 
     await db.flush()
     return await get_user_by_id(db, user.id)  # type: ignore[return-value]
 
 
 async def update_user_password(db: AsyncSession, user: User, new_password: str) -> None:
-    user.password_hash = hash_password(new_password)
+    user.password_hash = await hash_password(new_password)
     await db.flush()
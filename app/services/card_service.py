@@ -1,15 +1,24 @@
+import asyncio
 import csv
 import io
+import itertools
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.config import settings
 from app.core.gamification_config import XP_SET_CREATED
+from app.core.pagination import (
+    decode_created_cursor,
+    decode_order_cursor,
+    encode_cursor,
+)
 from app.models.card import Card, CardSet, CardType
 from app.models.gamification import XpEventType
 from app.models.user import LanguageLevel, User
@@ -23,20 +32,25 @@ from app.schemas.card import (
 )
 
 
+# First-cell labels that mark a header row in imported CSV files
+_HEADER_TOKENS = frozenset({"front", "front_text", "word", "term", "question"})
+
 # --- Helpers ---
 
 async def _update_card_count(db: AsyncSession, card_set_id: uuid.UUID) -> int:
+    # Count and write in one UPDATE instead of two SELECTs plus a flush
     result = await db.execute(
-        select(func.count()).where(Card.card_set_id == card_set_id)
-    )
-    count = result.scalar_one()
-    result2 = await db.execute(
-        select(CardSet).where(CardSet.id == card_set_id)
+        update(CardSet)
+        .where(CardSet.id == card_set_id)
+        .values(
+            card_count=select(func.count())
+            .where(Card.card_set_id == card_set_id)
+            .scalar_subquery()
+        )
+        .returning(CardSet.card_count)
+        .execution_options(synchronize_session=False)
     )
-    card_set = result2.scalar_one()
-    card_set.card_count = count
-    await db.flush()
-    return count
+    return result.scalar_one()
 
 
 async def count_user_card_sets(db: AsyncSession, user_id: uuid.UUID) -> int:
@@ -139,83 +153,92 @@ async def create_card_set(
     # Award XP for creating a set
     await award_xp(db, user, XP_SET_CREATED, XpEventType.set_created)
 
-    result = await db.execute(
-        select(CardSet)
-        .options(selectinload(CardSet.cards))
-        .where(CardSet.id == card_set.id)
-    )
-    return result.scalar_one()
+    # A fresh set has no cards; mark the collection loaded instead of
+    # running a reload SELECT just to discover it is empty
+    set_committed_value(card_set, "cards", [])
+    return card_set
+
+
+def _card_set_cursor(card_set: CardSet) -> str:
+    return encode_cursor(card_set.created_at.isoformat(), card_set.id)
 
 
 async def list_user_card_sets(
     db: AsyncSession,
     user: User,
-    skip: int = 0,
+    after: str | None = None,
     limit: int = 20,
     q: str | None = None,
     category: str | None = None,
     difficulty_level: LanguageLevel | None = None,
-) -> tuple[list[CardSet], int]:
+) -> tuple[list[CardSet], bool, str | None]:
     query = select(CardSet).where(CardSet.user_id == user.id)
-    count_query = select(func.count()).select_from(CardSet).where(CardSet.user_id == user.id)
 
     if q:
         pattern = f"%{q}%"
-        filter_clause = CardSet.title.ilike(pattern) | CardSet.description.ilike(pattern)
-        query = query.where(filter_clause)
-        count_query = count_query.where(filter_clause)
+        query = query.where(
+            CardSet.title.ilike(pattern) | CardSet.description.ilike(pattern)
+        )
 
     if category:
         query = query.where(CardSet.category == category)
-        count_query = count_query.where(CardSet.category == category)
 
     if difficulty_level:
         query = query.where(CardSet.difficulty_level == difficulty_level)
-        count_query = count_query.where(CardSet.difficulty_level == difficulty_level)
 
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    if after:
+        # Keyset seek: resume strictly after the last row of the previous page
+        query = query.where(
+            tuple_(CardSet.created_at, CardSet.id) < decode_created_cursor(after)
+        )
 
-    query = query.order_by(CardSet.created_at.desc()).offset(skip).limit(limit)
+    # Fetch one extra row instead of a separate COUNT(*) round-trip
+    query = query.order_by(CardSet.created_at.desc(), CardSet.id.desc()).limit(limit + 1)
     result = await db.execute(query)
     items = list(result.scalars().all())
 
-    return items, total
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_cursor = _card_set_cursor(items[-1]) if has_more else None
+    return items, has_more, next_cursor
 
 
-async def list_public_card_sets(
+async def stream_public_card_sets(
     db: AsyncSession,
-    skip: int = 0,
+    after: tuple[datetime, uuid.UUID] | None = None,
     limit: int = 20,
     q: str | None = None,
     category: str | None = None,
     difficulty_level: LanguageLevel | None = None,
-) -> tuple[list[CardSet], int]:
+) -> AsyncIterator[CardSet]:
+    """Yield up to limit+1 public sets without materializing the page.
+
+    The extra row lets the caller detect has_more; rows arrive via
+    stream_scalars so the page is never held in memory twice. `after` is
+    the already-decoded cursor tuple: the endpoint validates it before
+    the response starts, where it can still answer with a clean 400.
+    """
     query = select(CardSet).where(CardSet.is_public.is_(True))
-    count_query = select(func.count()).select_from(CardSet).where(CardSet.is_public.is_(True))
 
     if q:
         pattern = f"%{q}%"
-        filter_clause = CardSet.title.ilike(pattern) | CardSet.description.ilike(pattern)
-        query = query.where(filter_clause)
-        count_query = count_query.where(filter_clause)
+        query = query.where(
+            CardSet.title.ilike(pattern) | CardSet.description.ilike(pattern)
+        )
 
     if category:
         query = query.where(CardSet.category == category)
-        count_query = count_query.where(CardSet.category == category)
 
     if difficulty_level:
         query = query.where(CardSet.difficulty_level == difficulty_level)
-        count_query = count_query.where(CardSet.difficulty_level == difficulty_level)
-
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
 
-    query = query.order_by(CardSet.created_at.desc()).offset(skip).limit(limit)
-    result = await db.execute(query)
-    items = list(result.scalars().all())
+    if after:
+        query = query.where(tuple_(CardSet.created_at, CardSet.id) < after)
 
-    return items, total
+    query = query.order_by(CardSet.created_at.desc(), CardSet.id.desc()).limit(limit + 1)
+    result = await db.stream_scalars(query)
+    async for card_set in result:
+        yield card_set
 
 
 async def update_card_set(
@@ -225,13 +248,9 @@ async def update_card_set(
     for field, value in update_data.items():
         setattr(card_set, field, value)
     await db.flush()
-
-    result = await db.execute(
-        select(CardSet)
-        .options(selectinload(CardSet.cards))
-        .where(CardSet.id == card_set.id)
-    )
-    return result.scalar_one()
+    # card_set arrived through get_card_set_for_owner with cards eagerly
+    # loaded; no reload needed
+    return card_set
 
 
 async def delete_card_set(db: AsyncSession, card_set: CardSet) -> None:
@@ -259,32 +278,41 @@ async def create_card(
 async def list_cards(
     db: AsyncSession,
     card_set: CardSet,
-    skip: int = 0,
+    after: str | None = None,
     limit: int = 50,
     q: str | None = None,
     card_type: CardType | None = None,
-) -> tuple[list[Card], int]:
+) -> tuple[list[Card], bool, str | None]:
     query = select(Card).where(Card.card_set_id == card_set.id)
-    count_query = select(func.count()).select_from(Card).where(Card.card_set_id == card_set.id)
 
     if q:
         pattern = f"%{q}%"
-        filter_clause = Card.front_text.ilike(pattern) | Card.back_text.ilike(pattern)
-        query = query.where(filter_clause)
-        count_query = count_query.where(filter_clause)
+        query = query.where(
+            Card.front_text.ilike(pattern) | Card.back_text.ilike(pattern)
+        )
 
     if card_type:
         query = query.where(Card.card_type == card_type)
-        count_query = count_query.where(Card.card_type == card_type)
 
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    if after:
+        query = query.where(
+            tuple_(Card.order_index, Card.created_at, Card.id)
+            > decode_order_cursor(after)
+        )
 
-    query = query.order_by(Card.order_index, Card.created_at).offset(skip).limit(limit)
+    query = query.order_by(Card.order_index, Card.created_at, Card.id).limit(limit + 1)
     result = await db.execute(query)
     items = list(result.scalars().all())
 
-    return items, total
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_cursor = None
+    if has_more:
+        last = items[-1]
+        next_cursor = encode_cursor(
+            last.order_index, last.created_at.isoformat(), last.id,
+        )
+    return items, has_more, next_cursor
 
 
 async def get_card(
@@ -324,56 +352,64 @@ async def bulk_create_cards(
 ) -> list[Card]:
     await _check_daily_card_limit(db, user, count=len(data.cards))
 
-    cards = []
-    for card_data in data.cards:
-        card = Card(
-            card_set_id=card_set.id,
-            **card_data.model_dump(),
-        )
-        db.add(card)
-        cards.append(card)
-    await db.flush()
+    # One multi-row INSERT instead of a unit-of-work flush per card;
+    # RETURNING hands back the rows in parameter order
+    result = await db.execute(
+        insert(Card).returning(Card, sort_by_parameter_order=True),
+        [
+            {"card_set_id": card_set.id, **card_data.model_dump()}
+            for card_data in data.cards
+        ],
+    )
+    cards = list(result.scalars().all())
     await _update_card_count(db, card_set.id)
     return cards
 
 
-async def import_cards_from_file(
-    db: AsyncSession, card_set: CardSet, file: UploadFile, user: User,
-) -> tuple[list[Card], int]:
-    content = await file.read()
+def _parse_csv(
+    content: bytes, card_set_id: uuid.UUID,
+) -> tuple[list[dict], int]:
+    """Decode and parse an uploaded CSV into (insert_rows, skipped).
+
+    Pure CPU work, so callers run it via asyncio.to_thread to keep
+    multi-MB imports off the event loop. Rows come back ready for the
+    bulk INSERT, built in a single pass over the reader so the parsed
+    file is never held in memory twice.
+    """
     try:
         text = content.decode("utf-8-sig")
     except UnicodeDecodeError:
         text = content.decode("latin-1")
 
-    # Detect delimiter
+    # Detect delimiter; nearly every file is plain comma-separated, so
+    # only pay for Sniffer when the sample is ambiguous
     sample = text[:2048]
-    try:
-        dialect = csv.Sniffer().sniff(sample, delimiters=",\t|;")
-        delimiter = dialect.delimiter
-    except csv.Error:
+    if "," in sample and "\t" not in sample and ";" not in sample and "|" not in sample:
         delimiter = ","
+    else:
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",\t|;")
+            delimiter = dialect.delimiter
+        except csv.Error:
+            delimiter = ","
 
     reader = csv.reader(io.StringIO(text), delimiter=delimiter)
-    rows = list(reader)
 
-    if not rows:
+    first = next(reader, None)
+    if first is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="File is empty",
         )
 
-    # Heuristic: skip header if first row looks like labels
-    start = 0
-    if rows[0] and rows[0][0].lower().strip() in (
-        "front", "front_text", "word", "term", "question",
-    ):
-        start = 1
+    # Heuristic: skip header if first row looks like labels,
+    # otherwise put it back in front of the stream
+    if not (first and first[0].strip().lower() in _HEADER_TOKENS):
+        reader = itertools.chain((first,), reader)
 
-    # Parse valid rows
-    valid_rows: list[tuple[str, str, str | None]] = []
+    valid_rows: list[dict] = []
     skipped = 0
-    for row in rows[start:]:
+    for row in reader:
         if len(row) < 2:
             skipped += 1
             continue
@@ -383,24 +419,36 @@ async def import_cards_from_file(
             skipped += 1
             continue
         example = row[2].strip() if len(row) > 2 and row[2].strip() else None
-        valid_rows.append((front[:500], back[:500], example))
+        valid_rows.append(
+            {
+                "card_set_id": card_set_id,
+                "front_text": front[:500],
+                "back_text": back[:500],
+                "example_sentence": example,
+                "card_type": CardType.flashcard,
+                "order_index": len(valid_rows),
+            }
+        )
+
+    return valid_rows, skipped
+
+
+async def import_cards_from_file(
+    db: AsyncSession, card_set: CardSet, file: UploadFile, user: User,
+) -> tuple[list[Card], int]:
+    content = await file.read()
+    valid_rows, skipped = await asyncio.to_thread(_parse_csv, content, card_set.id)
 
     # Check daily card limit before inserting
     await _check_daily_card_limit(db, user, count=len(valid_rows))
 
     cards: list[Card] = []
-    for i, (front, back, example) in enumerate(valid_rows):
-        card = Card(
-            card_set_id=card_set.id,
-            front_text=front,
-            back_text=back,
-            example_sentence=example,
-            card_type=CardType.flashcard,
-            order_index=i,
+    if valid_rows:
+        result = await db.execute(
+            insert(Card).returning(Card, sort_by_parameter_order=True),
+            valid_rows,
         )
-        db.add(card)
-        cards.append(card)
+        cards = list(result.scalars().all())
 
-    await db.flush()
     await _update_card_count(db, card_set.id)
     return cards, skipped
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import uuid
 from collections.abc import AsyncIterator
@@ -5,7 +6,7 @@ from datetime import datetime, timedelta, timezone
 
 from fastapi import HTTPException, status
 from redis.asyncio import Redis
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.attributes import flag_modified
 
@@ -16,17 +17,20 @@ from app.ai.conversation import (
 )
 from app.ai.scenarios import SCENARIOS, ScenarioConfig, ScenarioType
 from app.config import settings
+from app.database import async_session_factory
 from app.core.gamification_config import XP_CONVERSATION
+from app.core.pagination import decode_created_cursor, encode_cursor
 from app.models.conversation import AIConversation
 from app.models.gamification import XpEventType
 from app.models.user import User
+from app.schemas import _fast
 from app.schemas.conversation import (
     ConversationDetailResponse,
     ConversationEndResponse,
     ConversationFeedback,
+    ConversationFeedbackStatusResponse,
     ConversationMessage,
     ConversationStartResponse,
-    ConversationSummary,
     GrammarCorrection,
     WeeklyDialogueStatus,
 )
@@ -102,7 +106,7 @@ async def get_weekly_dialogue_status(
     user: User,
 ) -> WeeklyDialogueStatus:
     used = await _count_weekly_conversations(db, user.id)
-    return WeeklyDialogueStatus(
+    return WeeklyDialogueStatus.model_construct(
         used=used,
         limit=settings.AI_FREE_DIALOGUES_PER_WEEK,
         is_premium=user.is_premium,
@@ -115,7 +119,10 @@ async def start_conversation(
     user: User,
     scenario_type: ScenarioType,
 ) -> ConversationStartResponse:
-    # Check weekly limit for free users
+    # Rate limit first, then the weekly count: overlapping a second
+    # operation on the request's AsyncSession is illegal, and a 429
+    # raised mid-query would leave the session with a command in flight
+    await _check_rate_limit(redis, user)
     if not user.is_premium:
         used = await _count_weekly_conversations(db, user.id)
         if used >= settings.AI_FREE_DIALOGUES_PER_WEEK:
@@ -124,8 +131,6 @@ async def start_conversation(
                 detail=f"Weekly dialogue limit reached ({settings.AI_FREE_DIALOGUES_PER_WEEK}/week for free users).",
             )
 
-    await _check_rate_limit(redis, user)
-
     scenario = _get_scenario(scenario_type)
 
     # Create opening message
@@ -184,10 +189,15 @@ async def send_message(
     user: User,
     conversation_id: uuid.UUID,
     user_message: str,
-) -> tuple[list[dict], list[str], int]:
-    """Process user message: rate limit, grammar check, store. Returns (corrections, suggestions, turn_number)."""
+) -> tuple[asyncio.Task, int]:
+    """Process user message: rate limit, store, kick off grammar check.
+
+    Returns (grammar_task, turn_number). The grammar check runs concurrently
+    with reply streaming; the caller awaits the task once streaming ends and
+    persists the results via attach_corrections.
+    """
+    # Rate limit before touching the session; see start_conversation
     await _check_rate_limit(redis, user)
-
     conversation = await _load_conversation(db, conversation_id, user)
 
     if conversation.ended_at is not None:
@@ -216,23 +226,24 @@ async def send_message(
             last_ai_message = msg["content"]
             break
 
-    # Grammar check
+    # Fire the grammar check concurrently; it only depends on the user
+    # message and prior context, so it overlaps with reply streaming.
     native_lang = NATIVE_LANGUAGE_MAP.get(user.native_language, user.native_language)
-    corrections, suggestions = await check_grammar(
+    grammar_task = asyncio.create_task(check_grammar(
         user_message=user_message,
         last_ai_message=last_ai_message,
         level=user.language_level.value,
         native_language=native_lang,
-    )
+    ))
 
-    # Store user message
+    # Store user message; corrections are attached once the check completes
     now = datetime.now(timezone.utc)
     user_msg_record = {
         "role": "user",
         "content": user_message,
         "timestamp": now.isoformat(),
-        "corrections": corrections,
-        "suggestions": suggestions,
+        "corrections": None,
+        "suggestions": None,
     }
     messages.append(user_msg_record)
     conversation.messages = messages
@@ -240,7 +251,27 @@ async def send_message(
     flag_modified(conversation, "messages")
     await db.flush()
 
-    return corrections, suggestions, conversation.total_turns
+    return grammar_task, conversation.total_turns
+
+
+async def attach_corrections(
+    db: AsyncSession,
+    conversation_id: uuid.UUID,
+    user: User,
+    corrections: list[dict],
+    suggestions: list[str],
+) -> None:
+    """Persist grammar-check results on the most recent user message."""
+    conversation = await _load_conversation(db, conversation_id, user)
+    messages = conversation.messages or []
+    for msg in reversed(messages):
+        if msg["role"] == "user":
+            msg["corrections"] = corrections
+            msg["suggestions"] = suggestions
+            break
+    conversation.messages = messages
+    flag_modified(conversation, "messages")
+    await db.flush()
 
 
 async def generate_ai_reply_stream(
@@ -281,11 +312,62 @@ async def generate_ai_reply_stream(
     await db.flush()
 
 
+# Keep strong references to in-flight feedback tasks so they aren't GC'd
+_feedback_tasks: set[asyncio.Task] = set()
+
+
+async def _run_feedback_generation(
+    conversation_id: uuid.UUID,
+    messages: list[dict],
+    level: str,
+    native_language: str,
+    total_turns: int,
+) -> None:
+    """Generate end-of-conversation feedback outside the request path."""
+    try:
+        feedback_data = await generate_conversation_feedback(
+            messages=messages,
+            level=level,
+            native_language=native_language,
+        )
+        feedback_data["total_turns"] = total_turns
+        feedback_data["xp_earned"] = XP_CONVERSATION
+        async with async_session_factory() as session:
+            result = await session.execute(
+                select(AIConversation).where(AIConversation.id == conversation_id)
+            )
+            conversation = result.scalar_one_or_none()
+            if conversation is None:
+                return
+            conversation.feedback = feedback_data
+            flag_modified(conversation, "feedback")
+            await session.commit()
+    except Exception:
+        logger.exception(
+            "Background feedback generation failed for conversation %s",
+            conversation_id,
+        )
+
+
+def _feedback_from_data(feedback_data: dict, total_turns: int) -> ConversationFeedback:
+    return ConversationFeedback(
+        total_turns=feedback_data.get("total_turns", total_turns),
+        total_errors=feedback_data.get("total_errors", 0),
+        common_error_types=feedback_data.get("common_error_types", []),
+        strengths=feedback_data.get("strengths", []),
+        areas_to_improve=feedback_data.get("areas_to_improve", []),
+        overall_assessment=feedback_data.get("overall_assessment", ""),
+        xp_earned=feedback_data.get("xp_earned", 0),
+    )
+
+
 async def end_conversation(
     db: AsyncSession,
     user: User,
     conversation_id: uuid.UUID,
 ) -> ConversationEndResponse:
+    """End the conversation and award XP; feedback is generated in the
+    background and fetched via get_conversation_feedback."""
     conversation = await _load_conversation(db, conversation_id, user)
 
     if conversation.ended_at is not None:
@@ -297,52 +379,80 @@ async def end_conversation(
     messages = conversation.messages or []
     native_lang = NATIVE_LANGUAGE_MAP.get(user.native_language, user.native_language)
 
-    # Generate feedback via LLM
-    feedback_data = await generate_conversation_feedback(
-        messages=messages,
-        level=user.language_level.value,
-        native_language=native_lang,
-    )
-
     # Award XP
     xp_result = await award_xp(db, user, XP_CONVERSATION, XpEventType.conversation)
 
-    # Update conversation
     conversation.ended_at = datetime.now(timezone.utc)
-    feedback_data["total_turns"] = conversation.total_turns
-    feedback_data["xp_earned"] = XP_CONVERSATION
-    conversation.feedback = feedback_data
-    flag_modified(conversation, "feedback")
     await db.flush()
 
+    # Feedback takes a full Mistral round-trip, so it runs off the request
+    # path; the client polls GET /conversations/{id}/feedback.
+    task = asyncio.create_task(_run_feedback_generation(
+        conversation_id=conversation.id,
+        messages=list(messages),
+        level=user.language_level.value,
+        native_language=native_lang,
+        total_turns=conversation.total_turns,
+    ))
+    _feedback_tasks.add(task)
+    task.add_done_callback(_feedback_tasks.discard)
+
     return ConversationEndResponse(
         conversation_id=conversation.id,
-        feedback=ConversationFeedback(
-            total_turns=conversation.total_turns,
-            total_errors=feedback_data.get("total_errors", 0),
-            common_error_types=feedback_data.get("common_error_types", []),
-            strengths=feedback_data.get("strengths", []),
-            areas_to_improve=feedback_data.get("areas_to_improve", []),
-            overall_assessment=feedback_data.get("overall_assessment", ""),
-            xp_earned=XP_CONVERSATION,
-        ),
+        feedback_status="pending",
+    )
+
+
+async def get_conversation_feedback(
+    db: AsyncSession,
+    user: User,
+    conversation_id: uuid.UUID,
+) -> ConversationFeedbackStatusResponse:
+    conversation = await _load_conversation(db, conversation_id, user)
+
+    if conversation.ended_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Conversation has not ended yet",
+        )
+
+    if not conversation.feedback:
+        return ConversationFeedbackStatusResponse(
+            conversation_id=conversation.id,
+            status="pending",
+        )
+
+    return ConversationFeedbackStatusResponse(
+        conversation_id=conversation.id,
+        status="ready",
+        feedback=_feedback_from_data(conversation.feedback, conversation.total_turns),
     )
 
 
 async def list_conversations(
     db: AsyncSession,
     user: User,
-    skip: int = 0,
+    after: str | None = None,
     limit: int = 20,
-) -> list[ConversationSummary]:
+) -> tuple[list[_fast.ConversationSummary], str | None]:
+    query = select(AIConversation).where(AIConversation.user_id == user.id)
+    if after:
+        # Keyset seek: resume strictly after the last row of the previous page
+        query = query.where(
+            tuple_(AIConversation.started_at, AIConversation.id)
+            < decode_created_cursor(after)
+        )
+    # Fetch one extra row to detect a next page; emitting a cursor on
+    # every full page would send clients a trailing empty page whenever
+    # the total is a multiple of limit
     result = await db.execute(
-        select(AIConversation)
-        .where(AIConversation.user_id == user.id)
-        .order_by(AIConversation.started_at.desc())
-        .offset(skip)
-        .limit(limit)
+        query
+        .order_by(AIConversation.started_at.desc(), AIConversation.id.desc())
+        .limit(limit + 1)
     )
     conversations = result.scalars().all()
+    has_more = len(conversations) > limit
+    conversations = conversations[:limit]
 
     summaries = []
     for conv in conversations:
@@ -350,7 +460,7 @@ async def list_conversations(
         scenario_config = SCENARIOS.get(ScenarioType(scenario_type))
         title = scenario_config.title if scenario_config else scenario_type
 
-        summaries.append(ConversationSummary(
+        summaries.append(_fast.ConversationSummary(
             id=conv.id,
             scenario=conv.scenario,
             scenario_title=title,
@@ -359,7 +469,12 @@ async def list_conversations(
             total_turns=conv.total_turns,
             is_active=conv.ended_at is None,
         ))
-    return summaries
+
+    next_cursor = None
+    if has_more:
+        last = conversations[-1]
+        next_cursor = encode_cursor(last.started_at.isoformat(), last.id)
+    return summaries, next_cursor
 
 
 async def get_conversation(
@@ -8,23 +8,19 @@ from app.models.gamification import League, UserGamification
 from app.models.progress import UserCardProgress
 from app.models.user import User
 from app.services.gamification_service import get_today_xp
-from app.schemas.dashboard import (
-    DashboardCardSetItem,
-    DashboardGamification,
-    DashboardResponse,
-)
+from app.schemas import _fast
 
 
 async def get_dashboard_data(
     db: AsyncSession, user: User
-) -> DashboardResponse:
+) -> _fast.DashboardResponse:
     # 1. Gamification stats
     result = await db.execute(
         select(UserGamification).where(UserGamification.user_id == user.id)
     )
     gam = result.scalar_one_or_none()
 
-    gamification = DashboardGamification(
+    gamification = _fast.DashboardGamification(
         total_xp=gam.total_xp if gam else 0,
         level=gam.level if gam else 1,
         current_streak=gam.current_streak if gam else 0,
@@ -59,7 +55,7 @@ async def get_dashboard_data(
     now = datetime.now(timezone.utc)
 
     # 5. Per-set progress (batched)
-    recent_sets: list[DashboardCardSetItem] = []
+    recent_sets: list[_fast.DashboardCardSetItem] = []
     if recent_card_sets:
         set_ids = [cs.id for cs in recent_card_sets]
 
@@ -123,7 +119,7 @@ async def get_dashboard_data(
         for cs in recent_card_sets:
             due = due_reviewed_map.get(cs.id, 0) + new_cards_map.get(cs.id, 0)
             recent_sets.append(
-                DashboardCardSetItem(
+                _fast.DashboardCardSetItem(
                     id=cs.id,
                     title=cs.title,
                     category=cs.category,
@@ -178,7 +174,7 @@ async def get_dashboard_data(
     total_new = total_new_result.scalar_one()
     total_due_cards = total_due_reviewed + total_new
 
-    return DashboardResponse(
+    return _fast.DashboardResponse(
         gamification=gamification,
         today_xp=today_xp,
         daily_xp_goal=user.daily_xp_goal,
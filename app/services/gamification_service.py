@@ -4,11 +4,7 @@ from datetime import date, datetime, timedelta, timezone
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.gamification_config import (
-    LEAGUE_THRESHOLDS,
-    LEVEL_INCREMENT_AFTER_10,
-    LEVEL_THRESHOLDS,
-)
+from app.core.gamification_config import league_for_xp, level_for_xp
 from app.models.card import CardSet
 from app.models.gamification import (
     Achievement,
@@ -26,22 +22,12 @@ from app.schemas.gamification import AchievementResponse, XpAwardResult
 
 def calculate_level(total_xp: int) -> int:
     """Calculate user level based on total XP."""
-    # Walk thresholds for levels 1-10
-    for i in range(len(LEVEL_THRESHOLDS) - 1, -1, -1):
-        if total_xp >= LEVEL_THRESHOLDS[i]:
-            if i < len(LEVEL_THRESHOLDS) - 1:
-                return i + 1
-            # Beyond level 10
-            return 10 + (total_xp - LEVEL_THRESHOLDS[-1]) // LEVEL_INCREMENT_AFTER_10
-    return 1
+    return level_for_xp(total_xp)
 
 
 def calculate_league(total_xp: int) -> League:
     """Calculate user league based on total XP."""
-    for threshold, league in LEAGUE_THRESHOLDS:
-        if total_xp >= threshold:
-            return league
-    return League.Bronze
+    return league_for_xp(total_xp)
 
 
 def update_streak(gamification: UserGamification, today: date) -> None:
@@ -163,7 +149,9 @@ async def check_achievements(
             newly_unlocked.append(achievement)
 
     if newly_unlocked:
-        # Recalculate level/league after bonus XP
+        # Recalculate level/league after bonus XP and keep the
+        # denormalized unlock counter in step
+        gamification.achievements_unlocked += len(newly_unlocked)
         gamification.level = calculate_level(gamification.total_xp)
         gamification.league = calculate_league(gamification.total_xp)
         await db.flush()
@@ -11,22 +11,31 @@ from app.models.progress import UserCardProgress
 from app.models.user import User
 from app.core.gamification_config import XP_REVIEW_BASE, XP_REVIEW_BONUS
 from app.models.gamification import XpEventType
+from app.schemas import _fast
 from app.schemas.srs import (
-    RATING_TO_QUALITY,
     AchievementUnlock,
-    CardProgressResponse,
     ReviewRating,
     ReviewResponse,
-    StudyCardResponse,
     StudySetProgressResponse,
 )
 from app.services.card_service import get_card_set_or_public
 from app.services.gamification_service import award_xp
 
+# Total XP per rating folded once at import; per review this is a single
+# lookup on an enum member instead of base + string-keyed bonus math
+_RATING_XP: dict[ReviewRating, int] = {
+    rating: XP_REVIEW_BASE + XP_REVIEW_BONUS.get(rating.value, 0)
+    for rating in ReviewRating
+}
+
 
 # --- SM-2 Algorithm ---
 
-@dataclass
+# Ten years between reviews is effectively "learned forever"
+MAX_INTERVAL_DAYS = 3650
+
+
+@dataclass(frozen=True, slots=True)
 class SM2Result:
     ease_factor: float
     interval: int
@@ -61,7 +70,8 @@ def calculate_sm2(
         elif repetitions == 1:
             new_interval = 6
         else:
-            new_interval = round(interval * new_ef)
+            # Capped: keeps schedules sane and within the int2 column
+            new_interval = min(round(interval * new_ef), MAX_INTERVAL_DAYS)
         new_repetitions = repetitions + 1
     else:
         # Incorrect — reset
@@ -77,6 +87,21 @@ def calculate_sm2(
 
 # --- Service functions ---
 
+def _progress_struct(progress: UserCardProgress) -> _fast.CardProgressResponse:
+    return _fast.CardProgressResponse(
+        id=progress.id,
+        user_id=progress.user_id,
+        card_id=progress.card_id,
+        ease_factor=progress.ease_factor,
+        interval=progress.interval,
+        repetitions=progress.repetitions,
+        next_review_date=progress.next_review_date,
+        last_reviewed_at=progress.last_reviewed_at,
+        total_reviews=progress.total_reviews,
+        correct_reviews=progress.correct_reviews,
+    )
+
+
 async def get_due_cards(
     db: AsyncSession,
     user: User,
@@ -84,7 +109,7 @@ async def get_due_cards(
     limit: int = 20,
     new_first: bool = True,
     practice: bool = False,
-) -> list[StudyCardResponse]:
+) -> list[_fast.StudyCardResponse]:
     """Get cards due for review, including new (unreviewed) cards.
 
     If practice=True, returns ALL cards in the set regardless of SRS schedule.
@@ -105,7 +130,7 @@ async def get_due_cards(
         )
         result = await db.execute(query)
         return [
-            StudyCardResponse(
+            _fast.StudyCardResponse(
                 id=card.id,
                 card_set_id=card.card_set_id,
                 front_text=card.front_text,
@@ -116,13 +141,13 @@ async def get_due_cards(
                 card_type=card.card_type,
                 order_index=card.order_index,
                 created_at=card.created_at,
-                progress=CardProgressResponse.model_validate(progress) if progress else None,
+                progress=_progress_struct(progress) if progress else None,
             )
             for card, progress in result.tuples().all()
         ]
 
     now = datetime.now(timezone.utc)
-    results: list[StudyCardResponse] = []
+    results: list[_fast.StudyCardResponse] = []
 
     if new_first:
         # Cards that have never been reviewed by this user
@@ -142,7 +167,7 @@ async def get_due_cards(
         )
         new_result = await db.execute(new_cards_query)
         for card in new_result.scalars().all():
-            results.append(StudyCardResponse(
+            results.append(_fast.StudyCardResponse(
                 id=card.id,
                 card_set_id=card.card_set_id,
                 front_text=card.front_text,
@@ -175,7 +200,7 @@ async def get_due_cards(
         )
         due_result = await db.execute(due_query)
         for card, progress in due_result.tuples().all():
-            results.append(StudyCardResponse(
+            results.append(_fast.StudyCardResponse(
                 id=card.id,
                 card_set_id=card.card_set_id,
                 front_text=card.front_text,
@@ -186,7 +211,7 @@ async def get_due_cards(
                 card_type=card.card_type,
                 order_index=card.order_index,
                 created_at=card.created_at,
-                progress=CardProgressResponse.model_validate(progress),
+                progress=_progress_struct(progress),
             ))
 
     return results
@@ -220,7 +245,7 @@ async def submit_review(
     )
     progress = progress_result.scalar_one_or_none()
 
-    quality = RATING_TO_QUALITY[rating]
+    quality = rating.quality
     now = datetime.now(timezone.utc)
 
     if progress is None:
@@ -259,8 +284,7 @@ async def submit_review(
     await db.flush()
 
     # Award XP
-    xp_amount = XP_REVIEW_BASE + XP_REVIEW_BONUS.get(rating.value, 0)
-    xp_result = await award_xp(db, user, xp_amount, XpEventType.review)
+    xp_result = await award_xp(db, user, _RATING_XP[rating], XpEventType.review)
 
     return ReviewResponse(
         card_id=card_id,
@@ -0,0 +1,104 @@
+import json
+import uuid
+from datetime import datetime
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.models.user import LanguageLevel, User
+from app.models.user_interest import UserInterest
+from app.services.auth_service import REQUEST_USER_COLUMNS, get_user_by_id
+
+# TTL is on the order of the access-token lifetime; entries are deleted
+# eagerly on profile, admin and password mutations.
+USER_CACHE_TTL_SECONDS = 300
+
+
+def user_cache_key(user_id: uuid.UUID) -> str:
+    return f"user:{user_id}"
+
+
+def serialize_user(user: User) -> str:
+    return json.dumps({
+        "id": str(user.id),
+        "email": user.email,
+        "full_name": user.full_name,
+        "avatar_url": user.avatar_url,
+        "language_level": user.language_level.value,
+        "native_language": user.native_language,
+        "daily_xp_goal": user.daily_xp_goal,
+        "is_premium": user.is_premium,
+        "is_active": user.is_active,
+        "is_admin": user.is_admin,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+        "interests": [
+            {
+                "id": str(i.id),
+                "interest": i.interest,
+                "created_at": i.created_at.isoformat() if i.created_at else None,
+            }
+            for i in user.interests
+        ],
+    })
+
+
+def deserialize_user(raw: bytes | str) -> User:
+    """Rebuild a detached User (with interests) from its cached snapshot."""
+    data = json.loads(raw)
+    user_id = uuid.UUID(data["id"])
+    interests = []
+    for item in data["interests"]:
+        interest = UserInterest(
+            id=uuid.UUID(item["id"]),
+            user_id=user_id,
+            interest=item["interest"],
+            created_at=datetime.fromisoformat(item["created_at"])
+            if item["created_at"] else None,
+        )
+        make_transient_to_detached(interest)
+        interests.append(interest)
+    user = User(
+        id=user_id,
+        email=data["email"],
+        full_name=data["full_name"],
+        avatar_url=data["avatar_url"],
+        language_level=LanguageLevel(data["language_level"]),
+        native_language=data["native_language"],
+        daily_xp_goal=data["daily_xp_goal"],
+        is_premium=data["is_premium"],
+        is_active=data["is_active"],
+        is_admin=data["is_admin"],
+        created_at=datetime.fromisoformat(data["created_at"])
+        if data["created_at"] else None,
+        updated_at=datetime.fromisoformat(data["updated_at"])
+        if data["updated_at"] else None,
+    )
+    user.interests = interests
+    make_transient_to_detached(user)
+    return user
+
+
+async def get_cached_user(
+    redis: Redis,
+    db: AsyncSession,
+    user_id: uuid.UUID,
+) -> User | None:
+    """Cache-aside user lookup: Redis snapshot first, Postgres on miss."""
+    raw = await redis.get(user_cache_key(user_id))
+    if raw is not None:
+        # Re-attach the snapshot so updates in this request still persist
+        return await db.merge(deserialize_user(raw), load=False)
+
+    user = await get_user_by_id(db, user_id, columns=REQUEST_USER_COLUMNS)
+    if user is not None:
+        await redis.set(
+            user_cache_key(user_id), serialize_user(user),
+            ex=USER_CACHE_TTL_SECONDS,
+        )
+    return user
+
+
+async def invalidate_user(redis: Redis, user_id: uuid.UUID) -> None:
+    await redis.delete(user_cache_key(user_id))